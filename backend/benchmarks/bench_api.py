@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Hermetic in-process benchmark suite for the API.
+
+Mounts server.app on an httpx ASGI transport backed by mongomock-motor, so
+neither a MongoDB server nor a deployed URL is needed. The database is
+seeded through POST /api/seed-data and then scaled up with synthetic
+documents. Every handler is timed with the read caches cleared before each
+call (cold) and, for cacheable reads, also warm; serialize_object_id,
+ApiResponse construction and encode_json are timed directly.
+
+Usage:
+  python benchmarks/bench_api.py --save-baseline benchmarks/baseline.json
+  python benchmarks/bench_api.py --baseline benchmarks/baseline.json --threshold 0.25
+
+With --baseline the run exits non-zero if any case's median is slower than
+the baseline by more than the threshold (a fraction, 0.25 = 25%).
+
+Requires: httpx, mongomock-motor
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bson import ObjectId
+
+# Configure the app for an in-process run before it is imported
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ["ADMISSION_CONTROL"] = "false"
+os.environ["ENSURE_INDEXES"] = "false"
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    import httpx
+    from mongomock_motor import AsyncMongoMockClient
+except ImportError as e:  # pragma: no cover - benchmark-only dependencies
+    sys.exit(f"{e.name} is required for the benchmark suite: pip install httpx mongomock-motor")
+
+import server  # noqa: E402
+
+# server configures INFO logging; per-request client logs would dominate the output
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+# The fields the project cards render
+CARD_FIELDS = "_id,title,image,technologies"
+
+
+def synthetic_projects(count: int):
+    base = datetime.utcnow()
+    return [
+        {
+            "title": f"Synthetic Project {i}",
+            "description": "A futuristic application with advanced features and real-time processing. " * 2,
+            "duration": f"{30 + i % 60} Days",
+            "technologies": ["Java", "Spring Boot", "MySQL", "React.js", "Docker"][: 2 + i % 4],
+            "features": ["Secure authentication", "Real-time processing", "Encryption protocols"],
+            "responsibilities": ["Backend development", "Schema design"],
+            "liveDemo": f"https://project-{i}.space",
+            "github": f"https://github.com/faizankhan/project-{i}",
+            "image": "https://images.unsplash.com/photo-1537420327992-d6e192287183",
+            "isActive": i % 10 != 0,
+            "createdAt": base - timedelta(minutes=i),
+            "updatedAt": base - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_contacts(count: int):
+    base = datetime.utcnow()
+    return [
+        {
+            "name": f"Visitor {i}",
+            "email": f"visitor{i}@example.com",
+            "subject": "Loved the portfolio",
+            "message": "I came across your work and would like to discuss an opportunity.",
+            "status": "new",
+            "createdAt": base - timedelta(seconds=i),
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_skills(count: int):
+    categories = ["programming", "frameworks", "tools", "soft", "cloud"]
+    return [
+        {
+            "category": categories[i % len(categories)],
+            "name": f"Skill {i}",
+            "level": 50 + i % 50,
+            "categoryType": "Synthetic",
+            "createdAt": datetime.utcnow(),
+        }
+        for i in range(count)
+    ]
+
+
+class CountingDatabase:
+    """Delegates to a database, counting every collection access"""
+
+    def __init__(self, database):
+        self.database = database
+        self.accesses = 0
+
+    def __getattr__(self, name):
+        self.accesses += 1
+        return getattr(self.database, name)
+
+    def __getitem__(self, name):
+        self.accesses += 1
+        return self.database[name]
+
+
+def clear_caches():
+    server.response_cache.invalidate()
+    server.rendered_cache.invalidate()
+
+
+async def seed(client, scale: int):
+    response = await client.post("/api/seed-data")
+    response.raise_for_status()
+    await server.db.projects.insert_many(synthetic_projects(scale))
+    await server.db.contact.insert_many(synthetic_contacts(scale * 5))
+    await server.db.skills.insert_many(synthetic_skills(max(scale // 10, 1)))
+    await server.mark_collections_changed()
+
+
+async def time_async(func, iterations: int, before=None):
+    timings = []
+    for _ in range(iterations):
+        if before:
+            before()
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def time_sync(func, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings):
+    ordered = sorted(timings)
+    return {
+        "median_us": statistics.median(ordered) * 1e6,
+        "p90_us": ordered[int(len(ordered) * 0.9) - 1 if len(ordered) >= 10 else -1] * 1e6,
+        "iterations": len(ordered),
+    }
+
+
+async def run_suite(scale: int, iterations: int):
+    server.db = AsyncMongoMockClient()[os.environ["DB_NAME"]]
+    transport = httpx.ASGITransport(app=server.app)
+    results = {}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await seed(client, scale)
+        project_id = (await server.db.projects.find_one({"isActive": True}))["_id"]
+        carousel_ids = ",".join(str(doc["_id"]) for doc in await server.db.projects.find({}, {"_id": 1}).limit(20).to_list(length=20))
+
+        def request(method, path, **kwargs):
+            async def call():
+                response = await client.request(method, path, **kwargs)
+                if response.status_code >= 400:
+                    raise RuntimeError(f"{method} {path} returned {response.status_code}")
+            return call
+
+        skill = {"category": "tools", "name": "Docker", "level": 80, "categoryType": "DevOps"}
+        project = synthetic_projects(1)[0]
+        new_project = {key: project[key] for key in server.ProjectCreate.model_fields}
+        education = {"degree": "MSc", "institution": "Uni", "board": "B", "stream": "CS", "performance": "80%", "year": "2025"}
+        contact = {"name": "Bench", "email": "bench@example.com", "subject": "Hi", "message": "Benchmark"}
+
+        cacheable = {
+            "GET /api/portfolio": request("GET", "/api/portfolio"),
+            "GET /api/skills": request("GET", "/api/skills"),
+            "GET /api/projects": request("GET", "/api/projects"),
+            "GET /api/projects?fields=card": request("GET", "/api/projects", params={"fields": CARD_FIELDS}),
+            "GET /api/projects/{id}": request("GET", f"/api/projects/{project_id}"),
+            "GET /api/education": request("GET", "/api/education"),
+            "GET /api/bootstrap": request("GET", "/api/bootstrap"),
+            "GET /api/projects/search": request("GET", "/api/projects/search", params={"q": "spring boot mysql"}),
+            "GET /api/projects/facets": request("GET", "/api/projects/facets"),
+            "GET /api/projects?tech=..&limit=20": request(
+                "GET", "/api/projects", params=[("tech", "MySQL"), ("tech", "Docker"), ("limit", 20)]
+            ),
+        }
+        uncached = {
+            "GET /api/projects?limit=20": request("GET", "/api/projects", params={"limit": 20}),
+            "GET /api/projects?ids=(20 ids)": request("GET", "/api/projects", params={"ids": carousel_ids}),
+            "GET /api/contact": request("GET", "/api/contact"),
+            "GET /api/contact?limit=50": request("GET", "/api/contact", params={"limit": 50}),
+            "GET /api/contact/export": request("GET", "/api/contact/export"),
+            "POST /api/skills": request("POST", "/api/skills", json=skill),
+            "POST /api/skills/bulk": request("POST", "/api/skills/bulk", json=[skill] * 10),
+            "POST /api/projects": request("POST", "/api/projects", json=new_project),
+            "POST /api/education": request("POST", "/api/education", json=education),
+            "POST /api/contact": request("POST", "/api/contact", json=contact),
+            "POST /api/seed-data": request("POST", "/api/seed-data"),
+        }
+
+        for name, call in {**cacheable, **uncached}.items():
+            await call()  # warm-up
+            results[f"{name} [cold]"] = summarize(await time_async(call, iterations, before=clear_caches))
+        for name, call in cacheable.items():
+            await call()
+            results[f"{name} [warm]"] = summarize(await time_async(call, iterations))
+
+        # Scraper traffic: malformed ids and well-formed ids that do not exist.
+        # After the first miss neither may reach the database.
+        junk = {
+            "GET /api/projects/{malformed}": ("/api/projects/wp-login.php", 422),
+            "GET /api/projects/{missing}": (f"/api/projects/{ObjectId()}", 404),
+        }
+        counting = CountingDatabase(server.db)
+        server.db = counting
+        try:
+            for name, (path, status) in junk.items():
+                await client.get(path)  # warm-up; records the miss
+                counting.accesses = 0
+
+                async def call(path=path, status=status):
+                    response = await client.get(path)
+                    if response.status_code != status:
+                        raise RuntimeError(f"GET {path} returned {response.status_code}, expected {status}")
+                results[name] = summarize(await time_async(call, iterations))
+                results[name]["mongo_accesses"] = counting.accesses
+        finally:
+            server.db = counting.database
+
+        projects = await server.db.projects.find({"isActive": True}).sort("createdAt", -1).to_list(length=None)
+
+    serialized = server.serialize_object_id(projects)
+    message = "Projects retrieved successfully"
+    results["serialize_object_id(projects)"] = summarize(time_sync(lambda: server.serialize_object_id(projects), iterations))
+    results["ApiResponse(projects)"] = summarize(
+        time_sync(lambda: server.ApiResponse(success=True, data=serialized, message=message), iterations)
+    )
+    results["encode_json(envelope)"] = summarize(
+        time_sync(lambda: server.encode_json(server.api_envelope(True, projects, message)), iterations)
+    )
+    return results
+
+
+def compare(results, baseline, threshold: float):
+    regressions = []
+    for name, stats in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        change = stats["median_us"] / previous["median_us"] - 1
+        stats["change"] = change
+        if change > threshold:
+            regressions.append((name, previous["median_us"], stats["median_us"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1000, help="synthetic projects to add (contacts are 5x)")
+    parser.add_argument("--iterations", type=int, default=50, help="timed calls per case")
+    parser.add_argument("--save-baseline", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed median slowdown before failing")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_suite(args.scale, args.iterations))
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+    print(f"{'case':<42} {'median us':>12} {'p90 us':>12} {'vs baseline':>12}")
+    for name, stats in results.items():
+        change = f"{stats['change'] * 100:+.1f}%" if "change" in stats else ""
+        print(f"{name:<42} {stats['median_us']:>12.1f} {stats['p90_us']:>12.1f} {change:>12}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({
+                "timestamp": datetime.utcnow().isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "scale": args.scale,
+                "iterations": args.iterations,
+                "results": results,
+            }, f, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    touched = {name: stats["mongo_accesses"] for name, stats in results.items() if stats.get("mongo_accesses")}
+    for name, accesses in touched.items():
+        print(f"\n{name} reached MongoDB {accesses} time(s); junk ids must be answered in-process")
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold * 100:.0f}%:")
+        for name, before, after, change in regressions:
+            print(f"  {name}: {before:.1f} us -> {after:.1f} us ({change * 100:+.1f}%)")
+        sys.exit(1)
+    if touched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Instrumentation overhead benchmark.
+
+Measures the per-request cost of MetricsMiddleware by driving a trivial
+ASGI endpoint with and without it, and times a single histogram observe()
+and a MongoDB command listener round trip in isolation.
+
+Usage: python benchmarks/bench_metrics.py [--requests 50000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import server  # noqa: E402
+
+
+async def trivial_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def time_requests(app, count: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/portfolio", "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / count
+
+
+def time_calls(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50000)
+    args = parser.parse_args()
+
+    instrumented = server.MetricsMiddleware(trivial_app)
+
+    async def run():
+        # Warm up both paths before measuring
+        await time_requests(trivial_app, 1000)
+        await time_requests(instrumented, 1000)
+        bare = min([await time_requests(trivial_app, args.requests) for _ in range(3)])
+        wrapped = min([await time_requests(instrumented, args.requests) for _ in range(3)])
+        return bare, wrapped
+
+    bare, wrapped = asyncio.run(run())
+    print(f"Bare ASGI app:        {bare * 1e6:8.2f} us/request")
+    print(f"With MetricsMiddleware: {wrapped * 1e6:6.2f} us/request")
+    print(f"Overhead:             {(wrapped - bare) * 1e6:8.2f} us/request")
+
+    histogram = server.MetricHistogram("bench_seconds", "benchmark", ("route",))
+    observe = time_calls(lambda: histogram.observe(("/api/portfolio",), 0.0042), args.requests)
+    print(f"Histogram observe():  {observe * 1e6:8.2f} us")
+
+    listener = server.MongoCommandMetrics()
+    started = SimpleNamespace(command={"find": "projects"}, command_name="find", connection_id=("localhost", 27017), request_id=1)
+    succeeded = SimpleNamespace(command_name="find", connection_id=("localhost", 27017), request_id=1, duration_micros=850)
+
+    def command_round_trip():
+        listener.started(started)
+        listener.succeeded(succeeded)
+
+    command = time_calls(command_round_trip, args.requests)
+    print(f"Command listener:     {command * 1e6:8.2f} us/command")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+ObjectId conversion benchmark on large result sets.
+
+Compares the recursive serialize_object_id walk followed by encoding with
+encoding the raw Motor documents directly, letting the encoder hook
+stringify ObjectIds. Documents are shaped like GET /api/contact results.
+
+Usage: python benchmarks/bench_object_ids.py [--sizes 1000 10000 50000]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bson import ObjectId
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import server  # noqa: E402
+
+
+def make_contacts(count: int):
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"Visitor {i}",
+            "email": f"visitor{i}@example.com",
+            "subject": "Loved the portfolio",
+            "message": "Hi! I came across your work and would like to discuss an opportunity. " * 2,
+            "status": "new",
+            "createdAt": now,
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    message = "Contact messages retrieved successfully"
+    print(f"Encoder: {'orjson' if server.orjson is not None else 'stdlib json'}")
+    print(f"{'docs':>8} {'walk+encode ms':>16} {'encode hook ms':>16} {'speedup':>8}")
+    for size in args.sizes:
+        docs = make_contacts(size)
+
+        def walk():
+            return server.encode_json(server.api_envelope(True, server.serialize_object_id(docs), message))
+
+        def hook():
+            return server.encode_json(server.api_envelope(True, docs, message))
+
+        assert walk() == hook(), "encoder hook output differs from the walk"
+        walk_time = best_of(walk, args.repeat)
+        hook_time = best_of(hook, args.repeat)
+        print(f"{size:>8} {walk_time * 1000:>16.2f} {hook_time * 1000:>16.2f} {walk_time / hook_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark for the hot read path.
+
+Compares the original response path (ApiResponse -> jsonable_encoder ->
+JSONResponse) with the fast path (orjson envelope + rendered-bytes cache),
+both as raw encode calls and as full requests through the ASGI app.
+No MongoDB is needed: the read caches are primed with synthetic documents.
+
+Usage: python benchmarks/bench_serialization.py [--items 200] [--seconds 2]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bson import ObjectId
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+import server  # noqa: E402
+
+
+def make_projects(count: int):
+    """Synthetic project documents shaped like the seeded ones"""
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Project {i}",
+            "description": "A futuristic application with advanced features and real-time processing. " * 3,
+            "duration": "45 Days",
+            "technologies": ["Java", "Spring Boot", "MySQL", "RESTful APIs", "Docker"],
+            "features": ["Secure authentication", "Real-time processing", "Encryption protocols"],
+            "responsibilities": ["Backend development", "Schema design"],
+            "liveDemo": "https://demo.space",
+            "github": "https://github.com/faizankhan/project",
+            "image": "https://images.unsplash.com/photo-1537420327992-d6e192287183",
+            "isActive": True,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        for i in range(count)
+    ]
+
+
+def ops_per_second(func, seconds: float) -> float:
+    iterations = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        func()
+        iterations += 1
+    return iterations / (time.perf_counter() - start)
+
+
+async def asgi_rps(app, path: str, seconds: float) -> float:
+    """Drive raw ASGI GET requests at an app without any HTTP client"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} returned {message['status']}")
+
+    requests = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        await app(dict(scope), receive, send)
+        requests += 1
+    return requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200, help="number of project documents in the payload")
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of each measurement")
+    args = parser.parse_args()
+
+    raw = make_projects(args.items)
+    payload = server.serialize_object_id(raw)
+    message = "Projects retrieved successfully"
+
+    def legacy_encode():
+        return JSONResponse(content=jsonable_encoder(server.ApiResponse(success=True, data=payload, message=message))).body
+
+    def fast_encode():
+        return server.encode_json(server.api_envelope(True, payload, message))
+
+    legacy_body = legacy_encode()
+    fast_body = fast_encode()
+    print(f"Encoder: {'orjson' if server.orjson is not None else 'stdlib json'}")
+    print(f"Payload: {args.items} projects, {len(legacy_body)} bytes")
+    print(f"Byte-identical output: {legacy_body == fast_body}")
+
+    print("\nEncode only (ops/sec)")
+    print(f"  ApiResponse + jsonable_encoder: {ops_per_second(legacy_encode, args.seconds):12.1f}")
+    print(f"  fast envelope encode:           {ops_per_second(fast_encode, args.seconds):12.1f}")
+
+    # Legacy handler shape, minus the database
+    legacy_app = FastAPI()
+
+    @legacy_app.get("/api/projects")
+    async def legacy_projects():
+        return server.ApiResponse(success=True, data=payload, message=message)
+
+    # Prime the read cache so the real handler never reaches Mongo
+    server.response_cache.set("projects", payload)
+
+    async def run_requests():
+        before = await asgi_rps(legacy_app, "/api/projects", args.seconds)
+        after = await asgi_rps(server.app, "/api/projects", args.seconds)
+        return before, after
+
+    before, after = asyncio.run(run_requests())
+    print("\nGET /api/projects through ASGI (requests/sec)")
+    print(f"  before (ApiResponse per request): {before:10.1f}")
+    print(f"  after  (cached encoded bytes):    {after:10.1f}")
+    print(f"  speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
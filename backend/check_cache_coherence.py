@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Multi-process check that per-worker caches converge after a write.
+
+Starts several uvicorn processes serving server.app against a scratch
+database (DB_NAME + "_coherence", dropped afterwards), warms every worker's
+cache, creates a project through one worker and then polls the others until
+the new project shows up. Exits non-zero if any worker takes longer than
+VERSION_POLL_INTERVAL_SECONDS plus --slack to become consistent.
+
+Usage: python check_cache_coherence.py [--workers 3] [--poll-interval 0.5]
+
+Requires a reachable MONGO_URL.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+import requests
+
+BASE_PORT = 18400
+
+
+def serve(port: int, db_name: str, poll_interval: float, mongo_url: str):
+    os.environ["MONGO_URL"] = mongo_url
+    os.environ["DB_NAME"] = db_name
+    os.environ["VERSION_POLL_INTERVAL_SECONDS"] = str(poll_interval)
+    os.environ["ADMISSION_CONTROL"] = "false"
+    import uvicorn
+    import server
+    uvicorn.run(server.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def wait_until_up(url: str, timeout: float = 20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{url}/api/ready", timeout=1).status_code == 200:
+                return
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"worker at {url} did not start")
+
+
+def project_ids(url: str):
+    data = requests.get(f"{url}/api/projects", timeout=5).json()["data"]
+    return {project["_id"] for project in data}
+
+
+def run_check(mongo_url: str, db_name: str, workers: int = 3, poll_interval: float = 0.5, slack: float = 0.5):
+    """Run the check against a scratch database; returns (url, ok, delay in seconds) per worker"""
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=serve, args=(BASE_PORT + i, db_name, poll_interval, mongo_url), daemon=True)
+        for i in range(workers)
+    ]
+    urls = [f"http://127.0.0.1:{BASE_PORT + i}" for i in range(workers)]
+    bound = poll_interval + slack
+    results = []
+    try:
+        for process in processes:
+            process.start()
+        for url in urls:
+            wait_until_up(url)
+
+        requests.post(f"{urls[0]}/api/seed-data", timeout=15).raise_for_status()
+        # Let every worker see the seeded versions, then populate its cache
+        time.sleep(poll_interval)
+        for url in urls:
+            project_ids(url)
+
+        created = requests.post(f"{urls[0]}/api/projects", json={
+            "title": "Coherence Probe",
+            "description": "Created by check_cache_coherence.py",
+            "duration": "1 Day",
+            "technologies": ["Python"],
+            "features": ["Cache coherence"],
+            "liveDemo": "https://example.com",
+            "github": "https://github.com/example/probe",
+            "image": "https://example.com/probe.png"
+        }, timeout=5).json()["data"]["_id"]
+        written_at = time.monotonic()
+
+        for url in urls:
+            while created not in project_ids(url):
+                if time.monotonic() - written_at > bound * 4:
+                    break
+                time.sleep(0.02)
+            delay = time.monotonic() - written_at
+            consistent = created in project_ids(url)
+            results.append((url, consistent and delay <= bound, delay))
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=5)
+        from pymongo import MongoClient
+        MongoClient(mongo_url).drop_database(db_name)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="VERSION_POLL_INTERVAL_SECONDS for the workers")
+    parser.add_argument("--slack", type=float, default=0.5, help="allowed delay beyond the poll interval, in seconds")
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+    db_name = os.environ["DB_NAME"] + "_coherence"
+
+    results = run_check(os.environ["MONGO_URL"], db_name, args.workers, args.poll_interval, args.slack)
+    bound = args.poll_interval + args.slack
+    for url, ok, delay in results:
+        print(f"{'ok' if ok else 'FAIL':>4}  {url}  consistent after {delay * 1000:.0f} ms (bound {bound * 1000:.0f} ms)")
+    sys.exit(0 if all(ok for _, ok, _ in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
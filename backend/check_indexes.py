@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Verify that every query shape the API issues is served by an index.
+
+Creates the declared indexes (unless --no-create), runs explain() on each
+entry in server.QUERY_SHAPES and exits non-zero if any winning plan falls
+back to a COLLSCAN or an in-memory SORT stage.
+
+Usage: python check_indexes.py [--no-create]
+"""
+
+import argparse
+import asyncio
+import sys
+
+import server
+
+
+async def run(create: bool) -> int:
+    if create:
+        await server.ensure_indexes()
+
+    results = await server.explain_query_shapes()
+    failures = 0
+    for result in results:
+        status = "FAIL" if result["problems"] else "ok"
+        detail = ", ".join(result["problems"]) or " > ".join(reversed(result["stages"]))
+        print(f"{status:>4}  {result['name']:<24} {detail}")
+        if result["problems"]:
+            failures += 1
+
+    print(f"\n{len(results) - failures}/{len(results)} query shapes are index-backed")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--no-create", action="store_true", help="only check, do not create missing indexes")
+    args = parser.parse_args()
+    server.connect_mongo()
+    try:
+        sys.exit(asyncio.run(run(create=not args.no_create)))
+    finally:
+        server.close_mongo()
+
+
+if __name__ == "__main__":
+    main()
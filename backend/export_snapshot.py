@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Render the public read endpoints to static, precompressed JSON files.
+
+Every public GET (portfolio, skills, projects, each /projects/{id},
+education and bootstrap) is rendered in-process through server.app and
+written twice: once under a stable path (api/projects.json) and once under
+a content-hashed name (api/projects.<hash>.json) that can be cached forever.
+Each file gets .gz and, when brotli is installed, .br siblings. manifest.json
+maps every route to its files, ETag and the collections it depends on.
+
+After a write, regenerate only what changed:
+  python export_snapshot.py --out snapshot --incremental --collections projects
+
+Incremental runs revalidate each route with If-None-Match against the
+manifest ETag, so unchanged routes are not rewritten.
+
+Requires: httpx
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Render in-process without startup side effects or request limits
+os.environ["ADMISSION_CONTROL"] = "false"
+os.environ["METRICS_ENABLED"] = "false"
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - export-only dependency
+    sys.exit("httpx is required for the snapshot export: pip install httpx")
+
+import server
+
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+MANIFEST_NAME = "manifest.json"
+
+SECTION_ROUTES = {
+    "/api/portfolio": ["portfolio"],
+    "/api/skills": ["skills"],
+    "/api/projects": ["projects"],
+    "/api/education": ["education"],
+    "/api/bootstrap": ["portfolio", "skills", "projects", "education"],
+}
+
+
+async def list_project_ids(client) -> list:
+    """Ids of every active project, paging through /api/projects"""
+    ids = []
+    cursor = None
+    while True:
+        params = {"limit": server.MAX_PAGE_SIZE}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/projects", params=params)
+        response.raise_for_status()
+        page = response.json()["data"]
+        ids.extend(project["_id"] for project in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return ids
+
+
+def write_file(root: Path, relative: str, content: bytes):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(content)
+    tmp.replace(path)
+
+
+def write_route(root: Path, route: str, body: bytes, etag: str, last_modified, collections) -> dict:
+    base = route.lstrip("/")
+    digest = etag.strip('"')[:12]
+    entry = {
+        "file": f"{base}.json",
+        "versioned": f"{base}.{digest}.json",
+        "etag": etag,
+        "lastModified": last_modified,
+        "bytes": len(body),
+        "collections": collections,
+        "encodings": {},
+    }
+    write_file(root, entry["file"], body)
+    write_file(root, entry["versioned"], body)
+    for encoding in server.SUPPORTED_ENCODINGS:
+        compressed = server.compress(body, encoding, cached=True)
+        suffix = ".gz" if encoding == "gzip" else ".br"
+        write_file(root, entry["file"] + suffix, compressed)
+        write_file(root, entry["versioned"] + suffix, compressed)
+        entry["encodings"][encoding] = {"file": entry["versioned"] + suffix, "bytes": len(compressed)}
+    return entry
+
+
+async def export(out: Path, incremental: bool, collections, prune: bool) -> dict:
+    manifest_path = out / MANIFEST_NAME
+    previous = {}
+    if incremental and manifest_path.exists():
+        previous = json.loads(manifest_path.read_text()).get("routes", {})
+
+    def affected(route_collections) -> bool:
+        return not collections or any(name in collections for name in route_collections)
+
+    routes = {}
+    written = skipped = 0
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://snapshot") as client:
+        targets = dict(SECTION_ROUTES)
+        if affected(["projects"]) or not previous:
+            for project_id in await list_project_ids(client):
+                targets[f"/api/projects/{project_id}"] = ["projects"]
+        else:
+            # Project list untouched: carry the per-project routes over as they are
+            targets.update({
+                route: entry["collections"] for route, entry in previous.items() if route.startswith("/api/projects/")
+            })
+
+        for route, route_collections in targets.items():
+            old = previous.get(route)
+            if old and not affected(route_collections):
+                routes[route] = old
+                skipped += 1
+                continue
+            headers = {"Accept-Encoding": "identity"}
+            if old:
+                headers["If-None-Match"] = old["etag"]
+            response = await client.get(route, headers=headers)
+            if response.status_code == 304:
+                routes[route] = old
+                skipped += 1
+                continue
+            response.raise_for_status()
+            routes[route] = write_route(
+                out, route, response.content, response.headers["etag"],
+                response.headers.get("last-modified"), route_collections
+            )
+            written += 1
+
+    manifest = {
+        "generatedAt": datetime.utcnow().isoformat() + "Z",
+        "routes": dict(sorted(routes.items())),
+    }
+    write_file(out, MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+
+    removed = 0
+    if prune:
+        referenced = {MANIFEST_NAME}
+        for entry in routes.values():
+            for name in (entry["file"], entry["versioned"]):
+                referenced.update({name, name + ".gz", name + ".br"})
+        for path in out.rglob("*"):
+            if path.is_file() and path.relative_to(out).as_posix() not in referenced:
+                path.unlink()
+                removed += 1
+
+    print(f"Snapshot at {out}: {written} routes written, {skipped} unchanged, {removed} stale files pruned")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="snapshot", help="output directory")
+    parser.add_argument("--incremental", action="store_true", help="reuse the existing manifest and skip unchanged routes")
+    parser.add_argument("--collections", nargs="+", choices=sorted(server.collection_versions),
+                        help="only regenerate routes that depend on these collections")
+    parser.add_argument("--prune", action="store_true", help="delete files no longer referenced by the manifest")
+    args = parser.parse_args()
+
+    server.connect_mongo()
+    try:
+        asyncio.run(export(Path(args.out), args.incremental, set(args.collections or []), args.prune))
+    finally:
+        server.close_mongo()
+
+
+if __name__ == "__main__":
+    main()
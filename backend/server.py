@@ -1,28 +1,283 @@
-from fastapi import FastAPI, APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, APIRouter, Request, Query, Body
+from fastapi.responses import JSONResponse, Response, StreamingResponse, PlainTextResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import io
+import csv
+import json
+import re
+import asyncio
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, ValidationError
 from typing import List, Optional, Dict, Any
 import uuid
-from datetime import datetime
+import gzip
+import time
+import math
+import bisect
+import heapq
+import threading
+import base64
+import hashlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument, monitoring
+from pymongo.errors import BulkWriteError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, gzip is used alone without it
+    brotli = None
 
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# Prometheus-format metrics. A minimal in-process registry: observe() is a
+# bisect plus two increments, and cumulative buckets are only built at scrape time.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _format_labels(labelnames, labels, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, labels)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+# Metrics updated from pymongo's monitoring threads are created with
+# threadsafe=True; request metrics only change on the event loop and skip the lock.
+class MetricCounter:
+    def __init__(self, name: str, documentation: str, labelnames=(), kind: str = "counter", threadsafe: bool = False):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.kind = kind
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock() if threadsafe else None
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        if self._lock is None:
+            self._values[labels] = self._values.get(labels, 0) + amount
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, labels: tuple, value: float):
+        self._values[labels] = value
+
+    def snapshot(self) -> Dict[tuple, float]:
+        return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+class MetricGauge(MetricCounter):
+    def __init__(self, name: str, documentation: str, labelnames=(), threadsafe: bool = False):
+        super().__init__(name, documentation, labelnames, kind="gauge", threadsafe=threadsafe)
+
+    def dec(self, labels: tuple = (), amount: float = 1):
+        self.inc(labels, -amount)
+
+class MetricHistogram:
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS, threadsafe: bool = False):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[tuple, list] = {}
+        self._lock = threading.Lock() if threadsafe else None
+
+    def observe(self, labels: tuple, value: float):
+        if self._lock is None:
+            self._observe(labels, value)
+            return
+        with self._lock:
+            self._observe(labels, value)
+
+    def _observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                bucket_labels = _format_labels(self.labelnames, labels, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            bucket_labels = _format_labels(self.labelnames, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {series[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+http_requests_total = MetricCounter("http_requests_total", "HTTP requests handled", ("method", "route", "status"))
+http_requests_in_flight = MetricGauge("http_requests_in_flight", "HTTP requests currently being handled")
+http_request_duration = MetricHistogram("http_request_duration_seconds", "HTTP request latency", ("method", "route", "status"))
+mongo_command_duration = MetricHistogram("mongodb_command_duration_seconds", "MongoDB command latency", ("collection", "command", "outcome"), threadsafe=True)
+mongo_pool_connections = MetricGauge("mongodb_pool_connections", "Open connections in the MongoDB pool", ("address",), threadsafe=True)
+mongo_pool_checked_out = MetricGauge("mongodb_pool_checked_out_connections", "MongoDB connections currently checked out", ("address",), threadsafe=True)
+mongo_pool_checkout_failures = MetricCounter("mongodb_pool_checkout_failures_total", "Failed MongoDB connection checkouts", ("address", "reason"), threadsafe=True)
+
+METRICS = [
+    http_requests_total,
+    http_requests_in_flight,
+    http_request_duration,
+    mongo_command_duration,
+    mongo_pool_connections,
+    mongo_pool_checked_out,
+    mongo_pool_checkout_failures,
+]
+
+def render_metrics() -> str:
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Times every command per collection; events arrive on pymongo's threads"""
+
+    def __init__(self):
+        self._collections: Dict[tuple, str] = {}
+
+    def started(self, event):
+        if event.command_name == "getMore":
+            # The command value is the cursor id; the collection is named separately
+            value = event.command.get("collection")
+        else:
+            value = event.command.get(event.command_name)
+        collection = value if isinstance(value, str) else ""
+        self._collections[(event.connection_id, event.request_id)] = collection
+
+    def _record(self, event, outcome: str):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        mongo_command_duration.observe((collection, event.command_name, outcome), event.duration_micros / 1e6)
+
+    def succeeded(self, event):
+        self._record(event, "success")
+
+    def failed(self, event):
+        self._record(event, "failure")
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    def pool_created(self, event):
+        mongo_pool_connections.set((f"{event.address[0]}:{event.address[1]}",), 0)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        mongo_pool_connections.inc((f"{event.address[0]}:{event.address[1]}",))
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        mongo_pool_connections.dec((f"{event.address[0]}:{event.address[1]}",))
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        mongo_pool_checkout_failures.inc((f"{event.address[0]}:{event.address[1]}", str(event.reason)))
+
+    def connection_checked_out(self, event):
+        mongo_pool_checked_out.inc((f"{event.address[0]}:{event.address[1]}",))
+
+    def connection_checked_in(self, event):
+        mongo_pool_checked_out.dec((f"{event.address[0]}:{event.address[1]}",))
+
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+
+# MongoDB connection. The client is created by the app lifespan in each worker
+# process rather than at import time, so pre-fork servers never share its
+# sockets or monitor threads across a fork.
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '0'))
+# 0 leaves the option unset (wait forever for a pooled connection / no operation timeout)
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '0'))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '30000'))
+MONGO_MAX_TIME_MS = int(os.environ.get('MONGO_MAX_TIME_MS', '0'))
+MONGO_READY_TIMEOUT_MS = int(os.environ.get('MONGO_READY_TIMEOUT_MS', '2000'))
+
+client: Optional[AsyncIOMotorClient] = None
+db = None
+
+def mongo_client_options() -> Dict[str, Any]:
+    options = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    }
+    if MONGO_WAIT_QUEUE_TIMEOUT_MS:
+        options["waitQueueTimeoutMS"] = MONGO_WAIT_QUEUE_TIMEOUT_MS
+    if MONGO_MAX_TIME_MS:
+        # Client-side operation timeout; the driver sends the remaining budget as maxTimeMS
+        options["timeoutMS"] = MONGO_MAX_TIME_MS
+    return options
+
+def connect_mongo():
+    """Create this process's client, if it has none yet, and return the database"""
+    global client, db
+    if client is None:
+        listeners = [MongoCommandMetrics()] if METRICS_ENABLED else []
+        # Pool events are cheap and also back the readiness endpoint
+        listeners.append(MongoPoolMetrics())
+        client = AsyncIOMotorClient(mongo_url, event_listeners=listeners, **mongo_client_options())
+        db = client[os.environ['DB_NAME']]
+    return db
+
+def close_mongo():
+    global client, db
+    if client is not None:
+        client.close()
+    client = None
+    db = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    connect_mongo()
+    await warm_up_mongo()
+    await create_indexes()
+    start_contact_write_behind()
+    try:
+        yield
+    finally:
+        try:
+            await contact_write_behind.stop()
+        finally:
+            close_mongo()
 
 # Create the main app without a prefix
-app = FastAPI(title="Space Portfolio API", version="1.0.0")
+app = FastAPI(title="Space Portfolio API", version="1.0.0", lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -37,6 +292,184 @@ def serialize_object_id(obj):
         return [serialize_object_id(item) for item in obj]
     return obj
 
+def utcnow() -> datetime:
+    """Current UTC time truncated to BSON's millisecond precision"""
+    now = datetime.utcnow()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+def inserted_document(doc: Dict[str, Any], inserted_id) -> Dict[str, Any]:
+    """The document as Mongo stored it: _id first, then the inserted fields"""
+    return {"_id": inserted_id, **{key: value for key, value in doc.items() if key != "_id"}}
+
+_OBJECT_ID_HEX = re.compile(r"[0-9a-fA-F]{24}")
+
+def parse_object_id(value: str) -> Optional[ObjectId]:
+    """The ObjectId for a 24-character hex string, or None if it is malformed"""
+    if not isinstance(value, str) or _OBJECT_ID_HEX.fullmatch(value) is None:
+        return None
+    return ObjectId(value)
+
+# ObjectIds on the read path are stringified by the JSON encoder hook instead of
+# walking every document up front. Set OBJECTID_ENCODING=walk to fall back to
+# serialize_object_id.
+OBJECTID_ENCODING = os.environ.get('OBJECTID_ENCODING', 'encoder')
+
+def convert_object_ids(docs):
+    """Prepare documents for encode_json; a no-op unless the walk fallback is enabled"""
+    if OBJECTID_ENCODING == 'walk':
+        return serialize_object_id(docs)
+    return docs
+
+# In-process read-through cache for the public GET endpoints
+class ResponseCache:
+    """Small TTL + LRU cache keyed by endpoint, invalidated by the write handlers"""
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 128):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *keys: str):
+        """Drop the given keys, or everything when called without arguments"""
+        if not keys:
+            self._entries.clear()
+            return
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "ttl": self.ttl,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+response_cache = ResponseCache(
+    ttl=float(os.environ.get('CACHE_TTL_SECONDS', '60')),
+    max_entries=int(os.environ.get('CACHE_MAX_ENTRIES', '128')),
+)
+
+# Per-collection version counters. The authoritative values live in a single
+# Mongo document that every write handler $inc's, so all workers share them;
+# each worker mirrors them here and polls for changes made by other workers.
+# Validators are memoized against these so a matching If-None-Match can be
+# answered without touching Mongo.
+collection_versions: Dict[str, int] = {
+    "portfolio": 0,
+    "skills": 0,
+    "projects": 0,
+    "education": 0,
+    "contact": 0,
+}
+
+# Final encoded response bodies, keyed by endpoint and collection versions
+rendered_cache = ResponseCache(
+    ttl=float(os.environ.get('CACHE_TTL_SECONDS', '60')),
+    max_entries=int(os.environ.get('RENDERED_CACHE_MAX_ENTRIES', '1024')),
+)
+
+VERSIONS_DOCUMENT_ID = "collections"
+# 0 reads the version document on every cacheable request
+VERSION_POLL_INTERVAL = float(os.environ.get('VERSION_POLL_INTERVAL_SECONDS', '1'))
+
+_versions_checked_at = 0.0
+_versions_refresh: Optional[asyncio.Future] = None
+
+def _apply_versions(remote: Optional[Dict[str, Any]]):
+    """Adopt the shared versions, dropping cached reads for every collection that moved"""
+    if not remote:
+        return
+    stale = []
+    for name in collection_versions:
+        version = remote.get(name, 0)
+        if version != collection_versions[name]:
+            collection_versions[name] = version
+            stale.append(name)
+    if stale:
+        response_cache.invalidate(*stale)
+
+async def refresh_collection_versions():
+    """Pick up writes made by other workers, at most once per VERSION_POLL_INTERVAL"""
+    global _versions_checked_at, _versions_refresh
+    if _versions_refresh is not None:
+        # Another request is already polling; share its result
+        await asyncio.shield(_versions_refresh)
+        return
+    if time.monotonic() - _versions_checked_at < VERSION_POLL_INTERVAL:
+        return
+    _versions_refresh = asyncio.get_running_loop().create_future()
+    try:
+        _apply_versions(await db.cache_versions.find_one({"_id": VERSIONS_DOCUMENT_ID}))
+    except Exception as e:
+        # Keep serving from cache; the next poll will retry
+        logger.warning("Failed to read collection versions: %s", e)
+    finally:
+        _versions_checked_at = time.monotonic()
+        _versions_refresh.set_result(None)
+        _versions_refresh = None
+
+async def mark_collections_changed(*collections: str):
+    """Bump the shared versions and drop cached reads after a write (all collections if none given)"""
+    names = collections or tuple(collection_versions)
+    remote = await db.cache_versions.find_one_and_update(
+        {"_id": VERSIONS_DOCUMENT_ID},
+        {"$inc": {name: 1 for name in names}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    _apply_versions(remote)
+    response_cache.invalidate(*collections)
+
+def cache_collection_read(name: str, version: int, value: Any):
+    """Cache a read of `name` unless a write bumped its version while the read was in flight"""
+    if collection_versions[name] == version:
+        response_cache.set(name, value)
+
+async def mark_collections_written(*collections: str):
+    """mark_collections_changed for a write that has already committed; never raises"""
+    global _versions_checked_at
+    try:
+        await mark_collections_changed(*collections)
+    except Exception as e:
+        # The write stands, so don't fail the request. Move this worker to a
+        # local version the shared document can never hold (they only count
+        # up from 0), so stale rendered bytes miss here and the next poll,
+        # forced below, adopts whatever the shared versions are by then.
+        logger.warning("Failed to bump collection versions after a write: %s", e)
+        for name in collections or tuple(collection_versions):
+            collection_versions[name] = -abs(collection_versions[name]) - 1
+        response_cache.invalidate(*collections)
+        _versions_checked_at = 0.0
+
 # Response Models
 class ApiResponse(BaseModel):
     success: bool
@@ -44,6 +477,377 @@ class ApiResponse(BaseModel):
     message: str
     error: Optional[str] = None
 
+# Fast JSON encoding. orjson is used when installed; the stdlib fallback is
+# configured to produce the same bytes as FastAPI's default JSONResponse.
+def _json_default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def encode_json(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=_json_default,
+    ).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes datetimes and ObjectIds natively"""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+def api_envelope(success: bool, data: Any = None, message: str = "", error: Optional[str] = None) -> Dict[str, Any]:
+    """Plain-dict equivalent of ApiResponse, field order included"""
+    return {"success": success, "data": data, "message": message, "error": error}
+
+# Response compression. Cached renders keep each compressed variant next to
+# the identity body, so a cache hit never pays for compression.
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+# Cached variants are compressed once per version, so they use stronger settings
+CACHED_GZIP_LEVEL = int(os.environ.get('CACHED_GZIP_LEVEL', '9'))
+CACHED_BROTLI_QUALITY = int(os.environ.get('CACHED_BROTLI_QUALITY', '9'))
+DYNAMIC_GZIP_LEVEL = int(os.environ.get('DYNAMIC_GZIP_LEVEL', '6'))
+DYNAMIC_BROTLI_QUALITY = int(os.environ.get('DYNAMIC_BROTLI_QUALITY', '4'))
+
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best supported content-coding for an Accept-Encoding header, or None for identity"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=CACHED_BROTLI_QUALITY if cached else DYNAMIC_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=CACHED_GZIP_LEVEL if cached else DYNAMIC_GZIP_LEVEL, mtime=0)
+
+class RenderedResponse:
+    """Encoded body, validators and lazily built compressed variants for one cache key"""
+    __slots__ = ("body", "etag", "last_modified", "variants")
+
+    def __init__(self, body: bytes, etag: str, last_modified: Optional[str]):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.variants: Dict[str, bytes] = {}
+
+    def variant(self, encoding: Optional[str]) -> bytes:
+        if encoding is None:
+            return self.body
+        compressed = self.variants.get(encoding)
+        if compressed is None:
+            compressed = self.variants[encoding] = compress(self.body, encoding, cached=True)
+        return compressed
+
+def _with_vary_accept_encoding(headers):
+    """Raw ASGI headers with Accept-Encoding added to any existing Vary list"""
+    vary = [value.decode("latin-1") for name, value in headers if name == b"vary"]
+    tokens = {token.strip().lower() for value in vary for token in value.split(",")}
+    if "accept-encoding" in tokens or "*" in tokens:
+        return list(headers)
+    merged = ", ".join(vary + ["Accept-Encoding"])
+    return [(name, value) for name, value in headers if name != b"vary"] + [(b"vary", merged.encode("latin-1"))]
+
+class CompressionMiddleware:
+    """Compresses complete, uncompressed responses; streaming bodies pass through untouched"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept_encoding)
+        
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = dict(message.get("headers", []))
+                if b"content-encoding" in headers:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            body = message.get("body", b"")
+            passthrough = True
+            if message.get("more_body") or len(body) < COMPRESSION_MIN_SIZE:
+                await send(start_message)
+                await send(message)
+                return
+            if encoding is None:
+                # Sent as identity only because of this request's Accept-Encoding
+                headers = _with_vary_accept_encoding(start_message.get("headers", []))
+                await send({**start_message, "headers": headers})
+                await send(message)
+                return
+            compressed = compress(body, encoding)
+            headers = [
+                (name, value) for name, value in start_message.get("headers", [])
+                if name != b"content-length"
+            ]
+            headers += [
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(compressed)).encode()),
+            ]
+            await send({**start_message, "headers": _with_vary_accept_encoding(headers)})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+# Conditional GET helpers (ETag / Last-Modified)
+def versioned_key(key: str, collections) -> str:
+    """Cache key for a rendered response, tied to the versions of the collections it reads"""
+    versions = ",".join(f"{name}={collection_versions.get(name, 0)}" for name in collections)
+    return f"{key}|{versions}"
+
+def _latest_timestamp(data) -> Optional[datetime]:
+    """Newest updatedAt/createdAt among the documents in a response payload"""
+    latest = None
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stamp = item.get("updatedAt") or item.get("createdAt")
+            if isinstance(stamp, datetime):
+                if latest is None or stamp > latest:
+                    latest = stamp
+            else:
+                # Grouped payloads (skills, bootstrap) nest documents one level down
+                stack.extend(value for value in item.values() if isinstance(value, (list, dict)))
+    return latest
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.replace(microsecond=0), usegmt=True)
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    # Only If-None-Match is honoured. Last-Modified is the newest document
+    # timestamp in the payload, which doesn't move when a document leaves the
+    # list (a deactivation), so If-Modified-Since alone could wrongly get a 304;
+    # when both are sent, If-None-Match takes precedence anyway.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    # Weak comparison function
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        # Compressed variants carry an encoding suffix on the same content hash
+        for encoding in SUPPORTED_ENCODINGS:
+            if tag.endswith(f'-{encoding}"'):
+                tag = tag[:-len(encoding) - 2] + '"'
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+def _send_rendered(request: Request, rendered: RenderedResponse) -> Response:
+    encoding = None
+    if len(rendered.body) >= COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    etag = rendered.etag if encoding is None else f'{rendered.etag[:-1]}-{encoding}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if rendered.last_modified:
+        headers["Last-Modified"] = rendered.last_modified
+    if _is_not_modified(request, rendered.etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=rendered.variant(encoding), media_type="application/json", headers=headers)
+
+def cached_response(request: Request, cache_key: str) -> Optional[Response]:
+    """Serve a GET from the rendered-bytes cache, before any database work"""
+    rendered = rendered_cache.get(cache_key)
+    if rendered is None:
+        return None
+    return _send_rendered(request, rendered)
+
+def render_response(request: Request, cache_key: str, data: Any, message: str) -> Response:
+    """Encode a success envelope once, cache the bytes and validators, and send it"""
+    body = encode_json(api_envelope(True, data, message))
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    latest = _latest_timestamp(data)
+    last_modified = _http_date(latest) if latest else None
+    rendered = RenderedResponse(body, etag, last_modified)
+    rendered_cache.set(cache_key, rendered)
+    return _send_rendered(request, rendered)
+
+# Keyset pagination helpers. Pages are ordered by (createdAt, _id) descending and
+# the cursor encodes the last key seen, so every page costs one indexed range scan.
+DEFAULT_PAGE_SIZE = int(os.environ.get('DEFAULT_PAGE_SIZE', '20'))
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', '100'))
+# While enabled, list requests without limit/cursor return the full list as before
+PAGINATION_COMPAT = os.environ.get('PAGINATION_COMPAT', 'true').lower() == 'true'
+
+class InvalidCursor(ValueError):
+    pass
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    key = {"createdAt": doc["createdAt"].isoformat(), "id": str(doc["_id"])}
+    return base64.urlsafe_b64encode(json.dumps(key, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(key["createdAt"]), ObjectId(key["id"])
+    except Exception as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+
+def is_paginated(limit: Optional[int], cursor: Optional[str]) -> bool:
+    return not PAGINATION_COMPAT or limit is not None or cursor is not None
+
+async def fetch_page(collection, base_filter: Dict[str, Any], cursor: Optional[str], limit: Optional[int],
+                     projection: Optional[Dict[str, int]] = None):
+    """Fetch one page of documents newest first; returns (documents, next_cursor)"""
+    limit = limit or DEFAULT_PAGE_SIZE
+    requested = projection
+    if projection is not None and "createdAt" not in projection:
+        # The next cursor is built from the sort key
+        projection = {**projection, "createdAt": 1}
+    query = dict(base_filter)
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query["$or"] = [
+            {"createdAt": {"$lt": created_at}},
+            {"createdAt": created_at, "_id": {"$lt": last_id}},
+        ]
+    # Read one extra document to learn whether another page exists
+    docs_cursor = collection.find(query, projection).sort([("createdAt", -1), ("_id", -1)]).limit(limit + 1)
+    docs = await docs_cursor.to_list(length=limit + 1)
+    next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+    docs = docs[:limit]
+    if projection is not requested:
+        for doc in docs:
+            doc.pop("createdAt", None)
+    return docs, next_cursor
+
+def invalid_cursor_response(e: InvalidCursor, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=400,
+        content=ApiResponse(
+            success=False,
+            error=str(e),
+            message=message
+        ).dict()
+    )
+
+# Index management. INDEX_SPECS is applied idempotently at startup and
+# QUERY_SHAPES lists every find() the handlers issue, for check_indexes.py.
+INDEX_SPECS: Dict[str, List[IndexModel]] = {
+    "projects": [
+        # Trailing _id keeps the keyset pagination sort fully index-backed
+        IndexModel([("isActive", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)], name="isActive_createdAt"),
+    ],
+    "contact": [
+        IndexModel([("createdAt", DESCENDING), ("_id", DESCENDING)], name="createdAt"),
+    ],
+    "education": [
+        IndexModel([("order", DESCENDING)], name="order"),
+    ],
+    "skills": [
+        IndexModel([("category", ASCENDING)], name="category"),
+        IndexModel([("level", DESCENDING), ("_id", ASCENDING)], name="level"),
+    ],
+}
+
+_SAMPLE_CURSOR_KEY = [
+    {"createdAt": {"$lt": datetime(2000, 1, 1)}},
+    {"createdAt": datetime(2000, 1, 1), "_id": {"$lt": ObjectId("0" * 24)}},
+]
+
+# allow_collscan marks unfiltered reads with no sort, where a scan is the
+# cheapest plan.
+QUERY_SHAPES: List[Dict[str, Any]] = [
+    {"name": "portfolio.find_one", "collection": "portfolio", "filter": {}, "sort": None, "allow_collscan": True},
+    # Leading $sort of SKILLS_GROUP_PIPELINE, which the server pushes down to the query layer
+    {"name": "skills.by_level", "collection": "skills", "filter": {}, "sort": [("level", -1), ("_id", 1)]},
+    {"name": "projects.active", "collection": "projects", "filter": {"isActive": True}, "sort": [("createdAt", -1)]},
+    {"name": "projects.by_ids", "collection": "projects", "filter": {"_id": {"$in": [ObjectId("0" * 24)]}}, "sort": None},
+    {"name": "projects.active_page", "collection": "projects", "filter": {"isActive": True, "$or": _SAMPLE_CURSOR_KEY}, "sort": [("createdAt", -1), ("_id", -1)]},
+    {"name": "education.ordered", "collection": "education", "filter": {}, "sort": [("order", -1)]},
+    {"name": "contact.newest", "collection": "contact", "filter": {}, "sort": [("createdAt", -1)]},
+    {"name": "contact.page", "collection": "contact", "filter": {"$or": _SAMPLE_CURSOR_KEY}, "sort": [("createdAt", -1), ("_id", -1)]},
+    {"name": "contact.export_since", "collection": "contact", "filter": {"createdAt": {"$gte": datetime(2000, 1, 1)}}, "sort": [("createdAt", 1), ("_id", 1)]},
+]
+
+async def ensure_indexes(database=None):
+    """Create every index in INDEX_SPECS; a no-op for indexes that already exist"""
+    database = database if database is not None else db
+    for collection, indexes in INDEX_SPECS.items():
+        names = await database[collection].create_indexes(indexes)
+        logger.info("Ensured indexes on %s: %s", collection, ", ".join(names))
+
+def _plan_stages(plan) -> List[str]:
+    stages = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "stage" in node:
+                stages.append(node["stage"])
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return stages
+
+async def explain_query_shapes(database=None) -> List[Dict[str, Any]]:
+    """Explain every entry in QUERY_SHAPES and flag collection scans and in-memory sorts"""
+    database = database if database is not None else db
+    results = []
+    for shape in QUERY_SHAPES:
+        cursor = database[shape["collection"]].find(shape["filter"])
+        if shape["sort"]:
+            cursor = cursor.sort(shape["sort"])
+        explanation = await cursor.explain()
+        stages = _plan_stages(explanation.get("queryPlanner", {}).get("winningPlan", {}))
+        problems = []
+        if "COLLSCAN" in stages and not shape.get("allow_collscan"):
+            problems.append("COLLSCAN")
+        if "SORT" in stages:
+            problems.append("in-memory SORT")
+        results.append({"name": shape["name"], "stages": stages, "problems": problems})
+    return results
+
 # Portfolio Models
 class PersonalInfo(BaseModel):
     name: str
@@ -105,6 +909,14 @@ class ProjectCreate(BaseModel):
     github: str
     image: str
 
+class ProjectStatusUpdate(BaseModel):
+    isActive: bool
+
+class ProjectLookup(BaseModel):
+    # Not List[str]: a malformed entry is reported on its own rather than failing the request
+    ids: List[Any]
+    fields: Optional[str] = None
+
 # Education Models
 class Education(BaseModel):
     id: Optional[str] = Field(default=None, alias="_id")
@@ -144,28 +956,491 @@ class ContactCreate(BaseModel):
     subject: str
     message: str
 
+# Sparse fieldsets. fields=a,b on a list endpoint becomes a Mongo projection,
+# so unrequested fields are never read, decoded or serialized. Each collection
+# accepts the fields of its model; _id is always returned.
+class InvalidFields(ValueError):
+    pass
+
+def _model_fields(model) -> frozenset:
+    return frozenset(field.alias or name for name, field in model.model_fields.items())
+
+FIELD_ALLOWLISTS: Dict[str, frozenset] = {
+    "projects": _model_fields(Project),
+    "skills": _model_fields(Skill),
+    "education": _model_fields(Education),
+    "contact": _model_fields(Contact),
+}
+
+def parse_fields(fields: Optional[str], collection: str) -> Optional[List[str]]:
+    """The requested fields in a canonical order, or None for whole documents"""
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise InvalidFields("fields must name at least one field")
+    unknown = requested - FIELD_ALLOWLISTS[collection]
+    if unknown:
+        allowed = ", ".join(sorted(FIELD_ALLOWLISTS[collection]))
+        raise InvalidFields(f"Unknown fields: {', '.join(sorted(unknown))} (allowed: {allowed})")
+    return sorted(requested | {"_id"})
+
+def field_projection(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+    return {name: 1 for name in fields} if fields is not None else None
+
+def invalid_fields_response(e: InvalidFields, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=400,
+        content=ApiResponse(
+            success=False,
+            error=str(e),
+            message=message
+        ).dict()
+    )
+
+# Bulk create helper
+BULK_MAX_ITEMS = int(os.environ.get('BULK_MAX_ITEMS', '1000'))
+
+def _validation_message(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}" for error in e.errors()
+    )
+
+async def bulk_insert(collection, model, items: List[Any], prepare) -> Dict[str, Any]:
+    """Validate every item, insert the valid ones with one unordered insert_many,
+    and report the outcome per input index"""
+    results: List[Dict[str, Any]] = [None] * len(items)
+    docs = []
+    doc_indexes = []
+    for index, item in enumerate(items):
+        try:
+            if not isinstance(item, dict):
+                raise TypeError("item must be a JSON object")
+            doc = prepare(model(**item).dict())
+        except ValidationError as e:
+            results[index] = {"index": index, "success": False, "error": _validation_message(e)}
+            continue
+        except TypeError as e:
+            results[index] = {"index": index, "success": False, "error": str(e)}
+            continue
+        docs.append(doc)
+        doc_indexes.append(index)
+    
+    write_errors = {}
+    if docs:
+        try:
+            await collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {error["index"]: error.get("errmsg", "write failed") for error in e.details.get("writeErrors", [])}
+    
+    # insert_many assigns _id to every document before sending the batch
+    for position, (index, doc) in enumerate(zip(doc_indexes, docs)):
+        if position in write_errors:
+            results[index] = {"index": index, "success": False, "error": write_errors[position]}
+        else:
+            results[index] = {"index": index, "success": True, "id": str(doc["_id"])}
+    
+    inserted = sum(1 for result in results if result["success"])
+    return {"inserted": inserted, "failed": len(items) - inserted, "results": results}
+
+def bulk_too_large_response(count: int, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=413,
+        content=ApiResponse(
+            success=False,
+            error=f"{count} items exceeds the limit of {BULK_MAX_ITEMS}",
+            message=message
+        ).dict()
+    )
+
+# Read-side loaders shared by the section endpoints and /bootstrap
+SKILL_CATEGORIES = ["programming", "frameworks", "tools", "soft"]
+
+SKILLS_GROUP_PIPELINE = [
+    {"$sort": {"level": -1, "_id": 1}},
+    {"$project": {"category": 1, "name": 1, "level": 1, "categoryType": 1, "createdAt": 1}},
+    # Skills without a category have always been listed under programming
+    {"$group": {"_id": {"$ifNull": ["$category", "programming"]}, "skills": {"$push": "$$ROOT"}}},
+    {"$sort": {"_id": 1}},
+]
+
+async def load_portfolio():
+    """Portfolio document with ObjectIds stringified, or None if not seeded"""
+    cached = response_cache.get("portfolio")
+    if cached is not None:
+        return cached
+    
+    version = collection_versions["portfolio"]
+    portfolio = await db.portfolio.find_one()
+    if not portfolio:
+        return None
+    
+    # ObjectIds are stringified at encode time
+    portfolio = convert_object_ids(portfolio)
+    cache_collection_read("portfolio", version, portfolio)
+    return portfolio
+
+def skills_group_pipeline(fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """SKILLS_GROUP_PIPELINE, projecting only the requested skill fields"""
+    if fields is None:
+        return SKILLS_GROUP_PIPELINE
+    # category is needed for grouping even when it is not returned
+    projection = {**field_projection(fields), "category": 1}
+    pipeline = [SKILLS_GROUP_PIPELINE[0], {"$project": projection}, *SKILLS_GROUP_PIPELINE[2:]]
+    if "category" not in fields:
+        pipeline.append({"$project": {"skills.category": 0}})
+    return pipeline
+
+async def group_skills(fields: Optional[List[str]] = None):
+    # The four legacy categories are always present; any others are discovered from the data
+    grouped_skills = {category: [] for category in SKILL_CATEGORIES}
+    
+    skills_cursor = db.skills.aggregate(skills_group_pipeline(fields))
+    async for group in skills_cursor:
+        grouped_skills[group["_id"]] = convert_object_ids(group["skills"])
+    return grouped_skills
+
+async def load_skills():
+    """Skills grouped by category, highest level first"""
+    cached = response_cache.get("skills")
+    if cached is not None:
+        return cached
+    
+    version = collection_versions["skills"]
+    grouped_skills = await group_skills()
+    
+    cache_collection_read("skills", version, grouped_skills)
+    return grouped_skills
+
+async def load_projects():
+    """Active projects, newest first"""
+    cached = response_cache.get("projects")
+    if cached is not None:
+        return cached
+    
+    version = collection_versions["projects"]
+    projects_cursor = db.projects.find({"isActive": True}).sort("createdAt", -1)
+    projects_list = await projects_cursor.to_list(length=None)
+    
+    # ObjectIds are stringified at encode time
+    projects_list = convert_object_ids(projects_list)
+    cache_collection_read("projects", version, projects_list)
+    return projects_list
+
+async def load_education():
+    """Education records ordered by the `order` field"""
+    cached = response_cache.get("education")
+    if cached is not None:
+        return cached
+    
+    version = collection_versions["education"]
+    education_cursor = db.education.find().sort("order", -1)
+    education_list = await education_cursor.to_list(length=None)
+    
+    # ObjectIds are stringified at encode time
+    education_list = convert_object_ids(education_list)
+    cache_collection_read("education", version, education_list)
+    return education_list
+
+# In-process indexes over the active projects (search, technology facets).
+# Writes made by this worker are applied in place when the projects version
+# moved by exactly that write; any other change (another worker, bulk create,
+# seeding) makes the index rebuild itself from Mongo on its next use.
+class ProjectIndex(ABC):
+    projection: Dict[str, int] = {}
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._lock = asyncio.Lock()
+        self._reset()
+
+    @abstractmethod
+    def _reset(self):
+        """Drop every indexed project"""
+
+    @abstractmethod
+    def _add(self, doc: Dict[str, Any]):
+        """Index one active project, replacing any earlier entry for it"""
+
+    @abstractmethod
+    def _remove(self, doc_id: str):
+        """Forget one project; a no-op if it is not indexed"""
+
+    async def ensure_current(self):
+        """Rebuild from Mongo if the projects collection changed since the last build"""
+        if self.version == collection_versions["projects"]:
+            return
+        async with self._lock:
+            version = collection_versions["projects"]
+            if self.version == version:
+                return
+            self._reset()
+            async for doc in db.projects.find({"isActive": True}, {**self.projection, "createdAt": 1}):
+                self._add(doc)
+            self.version = version
+
+    def apply_write(self, previous_version: int, added=(), removed=()):
+        """Apply a write this worker just made, if it was the only change since the last build"""
+        if self.version is None or self.version != previous_version:
+            return
+        if collection_versions["projects"] != previous_version + 1:
+            # Another worker wrote too; leave the index stale so the next use rebuilds it
+            return
+        for doc_id in removed:
+            self._remove(str(doc_id))
+        for doc in added:
+            self._add(doc)
+        self.version = collection_versions["projects"]
+
+def project_indexes_written(previous_version: int, added=(), removed=()):
+    for index in (project_search_index, project_facet_index):
+        index.apply_write(previous_version, added, removed)
+
+# Full-text project search. Each term's postings are also kept in descending
+# weight order, so a page is found with the threshold algorithm: it stops
+# reading once no unread posting can outrank the current top results, instead
+# of scoring every project that matches.
+SEARCH_FIELD_WEIGHTS = {"title": 5.0, "technologies": 3.0, "features": 1.0, "description": 1.0}
+SEARCH_MAX_QUERY_TERMS = 16
+
+_SEARCH_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+def search_tokens(text: str) -> List[str]:
+    """Lowercased terms; keeps names like c++, c#, node.js and asp.net whole"""
+    return _SEARCH_TOKEN.findall(text.lower())
+
+def _created_timestamp(doc: Dict[str, Any]) -> float:
+    created_at = doc.get("createdAt")
+    return created_at.replace(tzinfo=timezone.utc).timestamp() if created_at else 0.0
+
+class ProjectSearchIndex(ProjectIndex):
+    projection = {field: 1 for field in SEARCH_FIELD_WEIGHTS}
+
+    def _reset(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        # Per term: [(-weight, -createdAt, id)], re-sorted lazily after additions
+        self._ranked: Dict[str, List[tuple]] = {}
+        self._unsorted: set = set()
+        self._created: Dict[str, float] = {}
+        self._terms: Dict[str, List[str]] = {}
+
+    def _add(self, doc: Dict[str, Any]):
+        doc_id = str(doc["_id"])
+        self._remove(doc_id)
+        self._created[doc_id] = _created_timestamp(doc)
+        weights: Dict[str, float] = {}
+        for field, weight in SEARCH_FIELD_WEIGHTS.items():
+            value = doc.get(field)
+            if not value:
+                continue
+            text = " ".join(value) if isinstance(value, list) else str(value)
+            for term in search_tokens(text):
+                weights[term] = weights.get(term, 0.0) + weight
+        self._terms[doc_id] = list(weights)
+        for term, weight in weights.items():
+            self._postings.setdefault(term, {})[doc_id] = weight
+            self._ranked.setdefault(term, []).append((-weight, -self._created[doc_id], doc_id))
+            self._unsorted.add(term)
+
+    def _remove(self, doc_id: str):
+        created = self._created.pop(doc_id, None)
+        if created is None:
+            return
+        for term in self._terms.pop(doc_id):
+            weight = self._postings[term].pop(doc_id)
+            self._ranked[term].remove((-weight, -created, doc_id))
+            if not self._postings[term]:
+                del self._postings[term]
+                del self._ranked[term]
+                self._unsorted.discard(term)
+
+    def _ranked_postings(self, term: str) -> List[tuple]:
+        if term in self._unsorted:
+            self._ranked[term].sort()
+            self._unsorted.discard(term)
+        return self._ranked[term]
+
+    def search(self, query: str, top: int):
+        """The best `top` matching project ids by tf-idf with field weights (newest,
+        then lowest id, first among equal scores), and whether more matches follow them"""
+        total = len(self._created)
+        lists = []
+        for term in list(dict.fromkeys(search_tokens(query)))[:SEARCH_MAX_QUERY_TERMS]:
+            postings = self._postings.get(term)
+            if postings:
+                lists.append((math.log(1 + total / len(postings)), self._ranked_postings(term), postings))
+        if not lists:
+            return [], False
+        
+        # Results are totally ordered by (score, createdAt, inverted id), descending:
+        # the same order the posting lists are read in, so any `top` is a prefix
+        # of any larger `top` and pages never repeat or skip tied projects.
+        seen = set()
+        best: List[tuple] = []  # min-heap of (score, createdAt, -id, id), at most `top` long
+        depth = 0
+        while True:
+            threshold = 0.0
+            bound = None
+            exhausted = True
+            for idf, ranked, _ in lists:
+                if depth >= len(ranked):
+                    continue
+                exhausted = False
+                negative_weight, negative_created, doc_id = ranked[depth]
+                threshold -= negative_weight * idf
+                row_key = (-negative_created, -int(doc_id, 16))
+                bound = row_key if bound is None else min(bound, row_key)
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                score = sum(term_idf * postings.get(doc_id, 0.0) for term_idf, _, postings in lists)
+                entry = (score, self._created[doc_id], -int(doc_id, 16), doc_id)
+                if len(best) < top:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+            depth += 1
+            if exhausted:
+                break
+            # An unread project sits after this row in every list, so its key is
+            # below (threshold, oldest row createdAt / largest row id)
+            if len(best) == top and best[0][:3] >= (threshold, *bound):
+                break
+        
+        ranked_ids = [entry[3] for entry in sorted(best, reverse=True)]
+        has_more = len(seen) > len(best) or any(
+            doc_id not in seen for _, ranked, _ in lists for _, _, doc_id in ranked[depth:]
+        )
+        return ranked_ids, has_more
+
+    def stats(self) -> Dict[str, Any]:
+        return {"version": self.version, "documents": len(self._created), "terms": len(self._postings)}
+
+project_search_index = ProjectSearchIndex()
+
+# Technology facets: technology -> ids of the active projects that use it.
+# Technologies match case-insensitively and are displayed with the spelling
+# they were first seen with.
+class ProjectFacetIndex(ProjectIndex):
+    projection = {"technologies": 1}
+
+    def _reset(self):
+        self._projects: Dict[str, set] = {}
+        self._names: Dict[str, str] = {}
+        self._technologies: Dict[str, List[str]] = {}
+        # Keyset sort key per project, matching fetch_page's (createdAt, _id) order
+        self._sort_keys: Dict[str, tuple] = {}
+
+    def _add(self, doc: Dict[str, Any]):
+        doc_id = str(doc["_id"])
+        self._remove(doc_id)
+        keys = []
+        for name in doc.get("technologies") or []:
+            key = str(name).strip().lower()
+            if key and key not in keys:
+                keys.append(key)
+                self._names.setdefault(key, str(name).strip())
+                self._projects.setdefault(key, set()).add(doc_id)
+        self._technologies[doc_id] = keys
+        self._sort_keys[doc_id] = (doc.get("createdAt") or datetime.min, ObjectId(doc_id))
+
+    def _remove(self, doc_id: str):
+        for key in self._technologies.pop(doc_id, []):
+            self._projects[key].discard(doc_id)
+            if not self._projects[key]:
+                del self._projects[key]
+                del self._names[key]
+        self._sort_keys.pop(doc_id, None)
+
+    def facets(self) -> List[Dict[str, Any]]:
+        """Every technology with its active project count, most used first"""
+        counts = [{"name": self._names[key], "count": len(ids)} for key, ids in self._projects.items()]
+        counts.sort(key=lambda facet: (-facet["count"], facet["name"].lower()))
+        return counts
+
+    def matching(self, technologies: List[str], match_all: bool = True) -> List[tuple]:
+        """Sort keys of the projects using all (or any) of the technologies, newest first"""
+        sets = [self._projects.get(name.strip().lower(), set()) for name in technologies]
+        if match_all:
+            # Intersect starting from the rarest technology
+            sets.sort(key=len)
+            ids = set(sets[0]).intersection(*sets[1:]) if sets else set()
+        else:
+            ids = set().union(*sets)
+        return sorted((self._sort_keys[doc_id] for doc_id in ids), reverse=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"version": self.version, "documents": len(self._sort_keys), "technologies": len(self._projects)}
+
+project_facet_index = ProjectFacetIndex()
+
+def encode_offset_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode().rstrip("=")
+
+def decode_offset_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset = json.loads(base64.urlsafe_b64decode(padded.encode()))["offset"]
+    except Exception as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+    if not isinstance(offset, int) or offset < 0:
+        raise InvalidCursor("Invalid pagination cursor")
+    return offset
+
+# Bootstrap Endpoint
+@api_router.get("/bootstrap")
+async def get_bootstrap(request: Request):
+    """Get every portfolio section in one round trip"""
+    try:
+        await refresh_collection_versions()
+        cache_key = versioned_key("bootstrap", ("portfolio", "skills", "projects", "education"))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        
+        # The four reads are independent, so run them concurrently
+        portfolio, skills, projects, education = await asyncio.gather(
+            load_portfolio(),
+            load_skills(),
+            load_projects(),
+            load_education(),
+        )
+        
+        sections = {
+            "portfolio": portfolio,
+            "skills": skills,
+            "projects": projects,
+            "education": education
+        }
+        
+        return render_response(request, cache_key, sections, "Portfolio sections retrieved successfully")
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to retrieve portfolio sections"
+            ).dict()
+        )
+
 # Portfolio Endpoints
 @api_router.get("/portfolio")
-async def get_portfolio():
+async def get_portfolio(request: Request):
     """Get portfolio information"""
     try:
-        portfolio = await db.portfolio.find_one()
+        await refresh_collection_versions()
+        cache_key = versioned_key("portfolio", ("portfolio",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        
+        portfolio = await load_portfolio()
         if not portfolio:
             # Return default portfolio if none exists
-            return ApiResponse(
-                success=True,
-                data=None,
-                message="No portfolio data found"
-            )
-        
-        # Convert ObjectId to string
-        portfolio = serialize_object_id(portfolio)
+            return render_response(request, cache_key, None, "No portfolio data found")
         
-        return ApiResponse(
-            success=True,
-            data=portfolio,
-            message="Portfolio retrieved successfully"
-        )
+        return render_response(request, cache_key, portfolio, "Portfolio retrieved successfully")
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -178,33 +1453,21 @@ async def get_portfolio():
 
 # Skills Endpoints
 @api_router.get("/skills")
-async def get_skills():
+async def get_skills(request: Request, fields: Optional[str] = None):
     """Get all skills grouped by category"""
     try:
-        skills_cursor = db.skills.find()
-        skills_list = await skills_cursor.to_list(length=None)
-        
-        # Convert ObjectIds to strings
-        skills_list = serialize_object_id(skills_list)
-        
-        # Group skills by category
-        grouped_skills = {
-            "programming": [],
-            "frameworks": [],
-            "tools": [],
-            "soft": []
-        }
+        selected = parse_fields(fields, "skills")
+        await refresh_collection_versions()
+        cache_key = versioned_key(f"skills:{selected}" if selected else "skills", ("skills",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
         
-        for skill in skills_list:
-            category = skill.get("category", "programming")
-            if category in grouped_skills:
-                grouped_skills[category].append(skill)
+        grouped_skills = await group_skills(selected) if selected else await load_skills()
         
-        return ApiResponse(
-            success=True,
-            data=grouped_skills,
-            message="Skills retrieved successfully"
-        )
+        return render_response(request, cache_key, grouped_skills, "Skills retrieved successfully")
+    except InvalidFields as e:
+        return invalid_fields_response(e, "Failed to retrieve skills")
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -220,13 +1483,13 @@ async def create_skill(skill: SkillCreate):
     """Create a new skill"""
     try:
         skill_dict = skill.dict()
-        skill_dict["createdAt"] = datetime.utcnow()
+        skill_dict["createdAt"] = utcnow()
         
         result = await db.skills.insert_one(skill_dict)
+        await mark_collections_written("skills")
         
-        # Get the created skill
-        created_skill = await db.skills.find_one({"_id": result.inserted_id})
-        created_skill = serialize_object_id(created_skill)
+        # Echo the inserted document instead of reading it back
+        created_skill = serialize_object_id(inserted_document(skill_dict, result.inserted_id))
         
         return ApiResponse(
             success=True,
@@ -243,22 +1506,186 @@ async def create_skill(skill: SkillCreate):
             ).dict()
         )
 
-# Projects Endpoints
-@api_router.get("/projects")
-async def get_projects():
-    """Get all active projects"""
+@api_router.post("/skills/bulk")
+async def create_skills_bulk(items: List[Any] = Body(...)):
+    """Create many skills with a single insert, reporting success per item"""
+    if len(items) > BULK_MAX_ITEMS:
+        return bulk_too_large_response(len(items), "Failed to create skills")
     try:
-        projects_cursor = db.projects.find({"isActive": True}).sort("createdAt", -1)
-        projects_list = await projects_cursor.to_list(length=None)
+        def prepare(skill_dict):
+            skill_dict["createdAt"] = utcnow()
+            return skill_dict
         
-        # Convert ObjectIds to strings
-        projects_list = serialize_object_id(projects_list)
+        summary = await bulk_insert(db.skills, SkillCreate, items, prepare)
+        if summary["inserted"]:
+            await mark_collections_written("skills")
         
         return ApiResponse(
             success=True,
-            data=projects_list,
-            message="Projects retrieved successfully"
+            data=summary,
+            message=f"Created {summary['inserted']} of {len(items)} skills"
         )
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to create skills"
+            ).dict()
+        )
+
+async def fetch_projects_by_technology(technologies: List[str], match_all: bool, paginated: bool,
+                                       cursor: Optional[str], limit: Optional[int],
+                                       projection: Optional[Dict[str, int]] = None):
+    """Active projects using the technologies, resolved from the facet index and
+    fetched with one $in query; paginated like fetch_page when requested"""
+    await project_facet_index.ensure_current()
+    keys = project_facet_index.matching(technologies, match_all)
+    next_cursor = None
+    if paginated:
+        limit = limit or DEFAULT_PAGE_SIZE
+        start = 0
+        if cursor:
+            after = decode_cursor(cursor)
+            # keys are descending; skip everything at or before the cursor
+            start = bisect.bisect_left(keys, True, key=lambda key: key < after)
+        if start + limit < len(keys):
+            created_at, last_id = keys[start + limit - 1]
+            next_cursor = encode_cursor({"createdAt": created_at, "_id": last_id})
+        keys = keys[start:start + limit]
+    
+    ids = [project_id for _, project_id in keys]
+    docs = await db.projects.find({"_id": {"$in": ids}, "isActive": True}, projection).to_list(length=None)
+    by_id = {doc["_id"]: doc for doc in docs}
+    projects_list = convert_object_ids([by_id[project_id] for project_id in ids if project_id in by_id])
+    if paginated:
+        return {"items": projects_list, "next_cursor": next_cursor}
+    return projects_list
+
+# Project ids known not to exist, each stored with the projects version it was
+# checked at. Any write to projects (create_project, another worker's write once
+# polled) moves the version on and so retires every entry.
+project_negative_cache = ResponseCache(
+    ttl=float(os.environ.get('NEGATIVE_CACHE_TTL_SECONDS', '60')),
+    max_entries=int(os.environ.get('NEGATIVE_CACHE_MAX_ENTRIES', '10000')),
+)
+
+def project_not_found_response(message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=404,
+        content=ApiResponse(
+            success=False,
+            error="Project not found",
+            message=message
+        ).dict()
+    )
+
+def invalid_project_id_response(message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=422,
+        content=ApiResponse(
+            success=False,
+            error="Malformed project id",
+            message=message
+        ).dict()
+    )
+
+MULTI_GET_MAX_IDS = int(os.environ.get('MULTI_GET_MAX_IDS', '100'))
+
+async def fetch_projects_by_ids(ids: List[Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Resolve every id with one $in query, reporting each requested id in order"""
+    object_ids = [parse_object_id(project_id) for project_id in ids]
+    wanted = list({object_id for object_id in object_ids if object_id is not None})
+    docs = []
+    if wanted:
+        docs = await db.projects.find({"_id": {"$in": wanted}}, field_projection(fields)).to_list(length=None)
+    by_id = {doc["_id"]: doc for doc in docs}
+    
+    results = []
+    for project_id, object_id in zip(ids, object_ids):
+        if object_id is None:
+            results.append({"id": project_id, "success": False, "error": "Malformed project id"})
+        elif object_id not in by_id:
+            results.append({"id": project_id, "success": False, "error": "Project not found"})
+        else:
+            results.append({"id": project_id, "success": True, "project": by_id[object_id]})
+    found = sum(1 for result in results if result["success"])
+    return {"found": found, "failed": len(results) - found, "results": convert_object_ids(results)}
+
+def too_many_ids_response(count: int) -> JSONResponse:
+    return JSONResponse(
+        status_code=413,
+        content=ApiResponse(
+            success=False,
+            error=f"{count} ids exceeds the limit of {MULTI_GET_MAX_IDS}",
+            message="Failed to retrieve projects"
+        ).dict()
+    )
+
+# Projects Endpoints
+@api_router.get("/projects")
+async def get_projects(
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    tech: Optional[List[str]] = Query(default=None),
+    match: str = Query(default="all", pattern="^(all|any)$"),
+    fields: Optional[str] = None,
+    ids: Optional[str] = None
+):
+    """Get active projects, newest first (paginated when limit or cursor is given),
+    optionally only those using all (or any) of the given technologies.
+    With ids=a,b,c, get those projects instead, in the order given"""
+    try:
+        paginated = is_paginated(limit, cursor)
+        selected = parse_fields(fields, "projects")
+        projection = field_projection(selected)
+        if ids is not None:
+            requested_ids = [project_id.strip() for project_id in ids.split(",") if project_id.strip()]
+            if len(requested_ids) > MULTI_GET_MAX_IDS:
+                return too_many_ids_response(len(requested_ids))
+            await refresh_collection_versions()
+            cache_key = versioned_key(f"projects:ids:{requested_ids}:{selected}", ("projects",))
+            cached = cached_response(request, cache_key)
+            if cached is not None:
+                return cached
+            
+            data = await fetch_projects_by_ids(requested_ids, selected)
+            return render_response(request, cache_key, data, f"Retrieved {data['found']} of {len(requested_ids)} projects")
+        
+        await refresh_collection_versions()
+        if tech:
+            technologies = sorted({name.strip().lower() for name in tech})
+            cache_key = versioned_key(f"projects:tech:{match}:{technologies}:{limit}:{cursor}:{selected}", ("projects",))
+        elif selected:
+            cache_key = versioned_key(f"projects:{limit}:{cursor}:{selected}", ("projects",))
+        else:
+            cache_key = versioned_key(f"projects:{limit}:{cursor}" if paginated else "projects", ("projects",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        
+        if tech:
+            data = await fetch_projects_by_technology(technologies, match == "all", paginated, cursor, limit, projection)
+            return render_response(request, cache_key, data, "Projects retrieved successfully")
+        
+        if not paginated:
+            if selected:
+                projects_cursor = db.projects.find({"isActive": True}, projection).sort("createdAt", -1)
+                projects_list = convert_object_ids(await projects_cursor.to_list(length=None))
+            else:
+                projects_list = await load_projects()
+            return render_response(request, cache_key, projects_list, "Projects retrieved successfully")
+        
+        projects_list, next_cursor = await fetch_page(db.projects, {"isActive": True}, cursor, limit, projection)
+        page = {"items": convert_object_ids(projects_list), "next_cursor": next_cursor}
+        
+        return render_response(request, cache_key, page, "Projects retrieved successfully")
+    except InvalidCursor as e:
+        return invalid_cursor_response(e, "Failed to retrieve projects")
+    except InvalidFields as e:
+        return invalid_fields_response(e, "Failed to retrieve projects")
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -269,21 +1696,126 @@ async def get_projects():
             ).dict()
         )
 
+# Declared before /projects/{project_id} so "search" and "facets" are not taken for ids
+@api_router.post("/projects/lookup")
+async def lookup_projects(lookup: ProjectLookup):
+    """Get many projects by id in one query; the POST form of GET /projects?ids="""
+    if len(lookup.ids) > MULTI_GET_MAX_IDS:
+        return too_many_ids_response(len(lookup.ids))
+    try:
+        selected = parse_fields(lookup.fields, "projects")
+        data = await fetch_projects_by_ids(lookup.ids, selected)
+        return FastJSONResponse(api_envelope(True, data, f"Retrieved {data['found']} of {len(lookup.ids)} projects"))
+    except InvalidFields as e:
+        return invalid_fields_response(e, "Failed to retrieve projects")
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to retrieve projects"
+            ).dict()
+        )
+
+@api_router.get("/projects/facets")
+async def get_project_facets(request: Request):
+    """Get every technology used by active projects, with project counts"""
+    try:
+        await refresh_collection_versions()
+        cache_key = versioned_key("projects:facets", ("projects",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        
+        await project_facet_index.ensure_current()
+        facets = {"technologies": project_facet_index.facets(), "projects": project_facet_index.stats()["documents"]}
+        
+        return render_response(request, cache_key, facets, "Project facets retrieved successfully")
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to retrieve project facets"
+            ).dict()
+        )
+
+@api_router.get("/projects/search")
+async def search_projects(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """Search active projects by title, description, technologies and features, best match first"""
+    try:
+        limit = limit or DEFAULT_PAGE_SIZE
+        offset = decode_offset_cursor(cursor) if cursor else 0
+        selected = parse_fields(fields, "projects")
+        await refresh_collection_versions()
+        cache_key = versioned_key(f"projects:search:{q}:{limit}:{offset}:{selected}", ("projects",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        
+        await project_search_index.ensure_current()
+        ranked_ids, has_more = project_search_index.search(q, offset + limit)
+        page_ids = ranked_ids[offset:]
+        
+        # One indexed $in fetch for the page, returned in rank order
+        query = {"_id": {"$in": [ObjectId(doc_id) for doc_id in page_ids]}}
+        docs = await db.projects.find(query, field_projection(selected)).to_list(length=None)
+        by_id = {str(doc["_id"]): doc for doc in docs}
+        items = [by_id[doc_id] for doc_id in page_ids if doc_id in by_id]
+        
+        page = {
+            "items": convert_object_ids(items),
+            "next_cursor": encode_offset_cursor(offset + limit) if has_more else None
+        }
+        return render_response(request, cache_key, page, "Projects search completed successfully")
+    except InvalidCursor as e:
+        return invalid_cursor_response(e, "Failed to search projects")
+    except InvalidFields as e:
+        return invalid_fields_response(e, "Failed to search projects")
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to search projects"
+            ).dict()
+        )
+
 @api_router.get("/projects/{project_id}")
-async def get_project(project_id: str):
+async def get_project(project_id: str, request: Request):
     """Get single project by ID"""
+    # Junk ids are answered before any database work, including the version poll
+    object_id = parse_object_id(project_id)
+    if object_id is None:
+        return invalid_project_id_response("Failed to retrieve project")
+    project_id = str(object_id)
+    if project_negative_cache.get(project_id) == collection_versions["projects"]:
+        return project_not_found_response("Failed to retrieve project")
     try:
-        project = await db.projects.find_one({"_id": ObjectId(project_id)})
+        await refresh_collection_versions()
+        cache_key = versioned_key(f"project:{project_id}", ("projects",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        
+        version = collection_versions["projects"]
+        project = await db.projects.find_one({"_id": object_id})
         if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
+            project_negative_cache.set(project_id, version)
+            return project_not_found_response("Failed to retrieve project")
         
-        project = serialize_object_id(project)
+        project = convert_object_ids(project)
         
-        return ApiResponse(
-            success=True,
-            data=project,
-            message="Project retrieved successfully"
-        )
+        return render_response(request, cache_key, project, "Project retrieved successfully")
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -300,14 +1832,18 @@ async def create_project(project: ProjectCreate):
     try:
         project_dict = project.dict()
         project_dict["isActive"] = True
-        project_dict["createdAt"] = datetime.utcnow()
-        project_dict["updatedAt"] = datetime.utcnow()
+        project_dict["createdAt"] = utcnow()
+        project_dict["updatedAt"] = project_dict["createdAt"]
         
         result = await db.projects.insert_one(project_dict)
+        previous_version = collection_versions["projects"]
+        await mark_collections_written("projects")
+        project_indexes_written(previous_version, added=[inserted_document(project_dict, result.inserted_id)])
+        # Entries are already retired by the version bump; free the memory too
+        project_negative_cache.invalidate()
         
-        # Get the created project
-        created_project = await db.projects.find_one({"_id": result.inserted_id})
-        created_project = serialize_object_id(created_project)
+        # Echo the inserted document instead of reading it back
+        created_project = serialize_object_id(inserted_document(project_dict, result.inserted_id))
         
         return ApiResponse(
             success=True,
@@ -324,22 +1860,102 @@ async def create_project(project: ProjectCreate):
             ).dict()
         )
 
-# Education Endpoints
-@api_router.get("/education")
-async def get_education():
-    """Get all education records"""
+@api_router.post("/projects/bulk")
+async def create_projects_bulk(items: List[Any] = Body(...)):
+    """Create many projects with a single insert, reporting success per item"""
+    if len(items) > BULK_MAX_ITEMS:
+        return bulk_too_large_response(len(items), "Failed to create projects")
     try:
-        education_cursor = db.education.find().sort("order", -1)
-        education_list = await education_cursor.to_list(length=None)
+        def prepare(project_dict):
+            project_dict["isActive"] = True
+            project_dict["createdAt"] = utcnow()
+            project_dict["updatedAt"] = project_dict["createdAt"]
+            return project_dict
         
-        # Convert ObjectIds to strings
-        education_list = serialize_object_id(education_list)
+        summary = await bulk_insert(db.projects, ProjectCreate, items, prepare)
+        if summary["inserted"]:
+            await mark_collections_written("projects")
         
         return ApiResponse(
             success=True,
-            data=education_list,
-            message="Education records retrieved successfully"
+            data=summary,
+            message=f"Created {summary['inserted']} of {len(items)} projects"
         )
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to create projects"
+            ).dict()
+        )
+
+@api_router.patch("/projects/{project_id}")
+async def update_project_status(project_id: str, update: ProjectStatusUpdate):
+    """Activate or deactivate a project"""
+    try:
+        object_id = parse_object_id(project_id)
+        if object_id is None:
+            return invalid_project_id_response("Failed to update project")
+        
+        # Only write when the flag changes, so cached reads never lag a new updatedAt
+        changes = {"isActive": update.isActive, "updatedAt": utcnow()}
+        previous = await db.projects.find_one_and_update(
+            {"_id": object_id, "isActive": {"$ne": update.isActive}},
+            {"$set": changes},
+            return_document=ReturnDocument.BEFORE
+        )
+        if previous is None:
+            # Already in the requested state, or no such project
+            project = await db.projects.find_one({"_id": object_id})
+            if project is None:
+                return project_not_found_response("Failed to update project")
+        else:
+            project = {**previous, **changes}
+            previous_version = collection_versions["projects"]
+            await mark_collections_written("projects")
+            if update.isActive:
+                project_indexes_written(previous_version, added=[project])
+            else:
+                project_indexes_written(previous_version, removed=[project["_id"]])
+        
+        return ApiResponse(
+            success=True,
+            data=serialize_object_id(project),
+            message="Project updated successfully"
+        )
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to update project"
+            ).dict()
+        )
+
+# Education Endpoints
+@api_router.get("/education")
+async def get_education(request: Request, fields: Optional[str] = None):
+    """Get all education records"""
+    try:
+        selected = parse_fields(fields, "education")
+        await refresh_collection_versions()
+        cache_key = versioned_key(f"education:{selected}" if selected else "education", ("education",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
+        
+        if selected:
+            education_cursor = db.education.find({}, field_projection(selected)).sort("order", -1)
+            education_list = convert_object_ids(await education_cursor.to_list(length=None))
+        else:
+            education_list = await load_education()
+        
+        return render_response(request, cache_key, education_list, "Education records retrieved successfully")
+    except InvalidFields as e:
+        return invalid_fields_response(e, "Failed to retrieve education records")
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -355,13 +1971,13 @@ async def create_education(education: EducationCreate):
     """Create a new education record"""
     try:
         education_dict = education.dict()
-        education_dict["createdAt"] = datetime.utcnow()
+        education_dict["createdAt"] = utcnow()
         
         result = await db.education.insert_one(education_dict)
+        await mark_collections_written("education")
         
-        # Get the created education record
-        created_education = await db.education.find_one({"_id": result.inserted_id})
-        created_education = serialize_object_id(created_education)
+        # Echo the inserted document instead of reading it back
+        created_education = serialize_object_id(inserted_document(education_dict, result.inserted_id))
         
         return ApiResponse(
             success=True,
@@ -378,20 +1994,193 @@ async def create_education(education: EducationCreate):
             ).dict()
         )
 
+@api_router.post("/education/bulk")
+async def create_education_bulk(items: List[Any] = Body(...)):
+    """Create many education records with a single insert, reporting success per item"""
+    if len(items) > BULK_MAX_ITEMS:
+        return bulk_too_large_response(len(items), "Failed to create education records")
+    try:
+        def prepare(education_dict):
+            education_dict["createdAt"] = utcnow()
+            return education_dict
+        
+        summary = await bulk_insert(db.education, EducationCreate, items, prepare)
+        if summary["inserted"]:
+            await mark_collections_written("education")
+        
+        return ApiResponse(
+            success=True,
+            data=summary,
+            message=f"Created {summary['inserted']} of {len(items)} education records"
+        )
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Failed to create education records"
+            ).dict()
+        )
+
+# Write-behind queue for contact submissions
+class ContactWriteBehind:
+    """Buffers contact documents and flushes them with insert_many, by batch size or age"""
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 100, flush_interval: float = 0.5):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[Dict[str, Any]] = []
+        self.enqueued = 0
+        self.rejected = 0
+        self.flushed = 0
+        self.batches = 0
+        self.retries = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        self.queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run())
+
+    def offer(self, doc: Dict[str, Any]) -> bool:
+        """Queue a document; False means the caller must insert it synchronously"""
+        if not self.running:
+            return False
+        try:
+            self.queue.put_nowait(doc)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+        self.enqueued += 1
+        return True
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        failures = 0
+        try:
+            while True:
+                if not self._batch:
+                    self._batch = [await self.queue.get()]
+                    deadline = loop.time() + self.flush_interval
+                    while len(self._batch) < self.batch_size:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            self._batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                        except asyncio.TimeoutError:
+                            break
+                if await self._flush(self._batch):
+                    self._batch = []
+                    failures = 0
+                else:
+                    # Keep the batch and retry it; the queue absorbs new submissions meanwhile
+                    failures += 1
+                    self.retries += 1
+                    await asyncio.sleep(min(self.flush_interval * 2 ** failures, CONTACT_RETRY_MAX_DELAY))
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> bool:
+        """Insert one batch; False means nothing was written and the batch should be retried"""
+        if not batch:
+            return True
+        try:
+            await db.contact.insert_many(batch, ordered=False)
+            written = len(batch)
+        except BulkWriteError as e:
+            # Duplicate keys come from re-flushing a batch that was partly written
+            errors = e.details.get("writeErrors", [])
+            written = len(batch) - len(errors)
+            self.failed += sum(1 for error in errors if error.get("code") != 11000)
+        except Exception as e:
+            logger.warning("Failed to flush %d queued contact submissions: %s", len(batch), e)
+            return False
+        self.batches += 1
+        self.flushed += written
+        if written:
+            await mark_collections_written("contact")
+        return True
+
+    async def stop(self):
+        """Stop the background task and flush everything still buffered"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Contact write-behind task had failed: %s", e)
+        self._task = None
+        pending = self._batch
+        self._batch = []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            for attempt in range(CONTACT_STOP_ATTEMPTS):
+                if await self._flush(batch):
+                    break
+                if attempt + 1 < CONTACT_STOP_ATTEMPTS:
+                    await asyncio.sleep(self.flush_interval * 2 ** attempt)
+            else:
+                self.failed += len(batch)
+                logger.error("Dropped %d contact submissions that could not be written at shutdown", len(batch))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.running,
+            "depth": self.queue.qsize() if self.queue is not None else 0,
+            "maxQueue": self.max_queue,
+            "batchSize": self.batch_size,
+            "flushInterval": self.flush_interval,
+            "enqueued": self.enqueued,
+            "rejected": self.rejected,
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "retries": self.retries,
+            "failed": self.failed,
+        }
+
+CONTACT_WRITE_BEHIND = os.environ.get('CONTACT_WRITE_BEHIND', 'false').lower() == 'true'
+# Upper bound on the backoff between retries of a batch that failed to insert
+CONTACT_RETRY_MAX_DELAY = float(os.environ.get('CONTACT_RETRY_MAX_DELAY_SECONDS', '30'))
+# Insert attempts per batch when draining the queue at shutdown
+CONTACT_STOP_ATTEMPTS = int(os.environ.get('CONTACT_STOP_ATTEMPTS', '3'))
+
+contact_write_behind = ContactWriteBehind(
+    max_queue=int(os.environ.get('CONTACT_QUEUE_MAX', '10000')),
+    batch_size=int(os.environ.get('CONTACT_BATCH_SIZE', '100')),
+    flush_interval=float(os.environ.get('CONTACT_FLUSH_INTERVAL_SECONDS', '0.5')),
+)
+
 # Contact Endpoints
 @api_router.post("/contact")
 async def submit_contact(contact: ContactCreate):
     """Submit contact form"""
     try:
         contact_dict = contact.dict()
+        contact_dict["_id"] = ObjectId()
         contact_dict["status"] = "new"
-        contact_dict["createdAt"] = datetime.utcnow()
+        contact_dict["createdAt"] = utcnow()
         
-        result = await db.contact.insert_one(contact_dict)
+        # Acknowledge immediately when write-behind is on; insert inline when it is off or full
+        if not contact_write_behind.offer(contact_dict):
+            await db.contact.insert_one(contact_dict)
+            await mark_collections_written("contact")
         
         return ApiResponse(
             success=True,
-            data={"id": str(result.inserted_id)},
+            data={"id": str(contact_dict["_id"])},
             message="Message sent successfully! I'll get back to you soon."
         )
     except Exception as e:
@@ -405,20 +2194,40 @@ async def submit_contact(contact: ContactCreate):
         )
 
 @api_router.get("/contact")
-async def get_contacts():
-    """Get all contact messages"""
+async def get_contacts(
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """Get contact messages, newest first (paginated when limit or cursor is given)"""
     try:
-        contacts_cursor = db.contact.find().sort("createdAt", -1)
-        contacts_list = await contacts_cursor.to_list(length=None)
+        paginated = is_paginated(limit, cursor)
+        selected = parse_fields(fields, "contact")
+        projection = field_projection(selected)
+        await refresh_collection_versions()
+        cache_key = versioned_key(f"contact:{limit}:{cursor}:{selected}" if paginated else f"contact:{selected}", ("contact",))
+        cached = cached_response(request, cache_key)
+        if cached is not None:
+            return cached
         
-        # Convert ObjectIds to strings
-        contacts_list = serialize_object_id(contacts_list)
+        if not paginated:
+            contacts_cursor = db.contact.find({}, projection).sort("createdAt", -1)
+            contacts_list = await contacts_cursor.to_list(length=None)
+            
+            # ObjectIds are stringified at encode time
+            contacts_list = convert_object_ids(contacts_list)
+            
+            return render_response(request, cache_key, contacts_list, "Contact messages retrieved successfully")
         
-        return ApiResponse(
-            success=True,
-            data=contacts_list,
-            message="Contact messages retrieved successfully"
-        )
+        contacts_list, next_cursor = await fetch_page(db.contact, {}, cursor, limit, projection)
+        page = {"items": convert_object_ids(contacts_list), "next_cursor": next_cursor}
+        
+        return render_response(request, cache_key, page, "Contact messages retrieved successfully")
+    except InvalidCursor as e:
+        return invalid_cursor_response(e, "Failed to retrieve contact messages")
+    except InvalidFields as e:
+        return invalid_fields_response(e, "Failed to retrieve contact messages")
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -429,6 +2238,89 @@ async def get_contacts():
             ).dict()
         )
 
+@api_router.get("/contact/queue")
+async def get_contact_queue_stats():
+    """Get write-behind queue depth and flush counters"""
+    return ApiResponse(
+        success=True,
+        data=contact_write_behind.stats(),
+        message="Contact queue statistics retrieved successfully"
+    )
+
+# Contact export
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', '500'))
+CONTACT_EXPORT_FIELDS = ["_id", "name", "email", "subject", "message", "status", "createdAt"]
+
+async def _contact_batches(since: Optional[datetime]):
+    """Yield lists of contact documents, oldest first, one Motor batch at a time"""
+    query = {"createdAt": {"$gte": since}} if since else {}
+    contacts_cursor = db.contact.find(query).sort([("createdAt", 1), ("_id", 1)]).batch_size(EXPORT_BATCH_SIZE)
+    batch = []
+    async for contact in contacts_cursor:
+        batch.append(contact)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+async def _export_ndjson(since: Optional[datetime]):
+    async for batch in _contact_batches(since):
+        yield b"".join(encode_json(contact) + b"\n" for contact in batch)
+
+async def _export_csv(since: Optional[datetime]):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CONTACT_EXPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    async for batch in _contact_batches(since):
+        for contact in batch:
+            row = dict(contact)
+            row["_id"] = str(row["_id"])
+            if isinstance(row.get("createdAt"), datetime):
+                row["createdAt"] = row["createdAt"].isoformat()
+            writer.writerow(row)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    # Header-only export when there are no matching contacts
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+@api_router.get("/contact/export")
+async def export_contacts(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$"),
+    since: Optional[str] = None
+):
+    """Stream contact messages as NDJSON or CSV, optionally only those created at or after `since`"""
+    try:
+        since_dt = datetime.fromisoformat(since) if since else None
+    except ValueError as e:
+        return JSONResponse(
+            status_code=400,
+            content=ApiResponse(
+                success=False,
+                error=str(e),
+                message="Invalid 'since' timestamp, expected ISO 8601"
+            ).dict()
+        )
+    
+    if since_dt and since_dt.tzinfo is not None:
+        # Stored timestamps are naive UTC
+        since_dt = since_dt.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    if format == "csv":
+        return StreamingResponse(
+            _export_csv(since_dt),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="contacts-{stamp}.csv"'}
+        )
+    return StreamingResponse(
+        _export_ndjson(since_dt),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="contacts-{stamp}.ndjson"'}
+    )
+
 # Data seeding endpoint
 @api_router.post("/seed-data")
 async def seed_data():
@@ -569,6 +2461,8 @@ async def seed_data():
         
         await db.education.insert_many(education_data)
         
+        await mark_collections_written()
+        
         return ApiResponse(
             success=True,
             data=None,
@@ -585,8 +2479,316 @@ async def seed_data():
             ).dict()
         )
 
+# Cache diagnostics endpoint
+@api_router.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit/miss counters for the read-through response cache"""
+    return ApiResponse(
+        success=True,
+        data={**response_cache.stats(), "rendered": rendered_cache.stats(), "search": project_search_index.stats(), "facets": project_facet_index.stats(), "negative": project_negative_cache.stats()},
+        message="Cache statistics retrieved successfully"
+    )
+
+# Readiness endpoint
+def mongo_pool_state() -> Dict[str, Any]:
+    open_connections = mongo_pool_connections.snapshot()
+    checked_out = mongo_pool_checked_out.snapshot()
+    failures = sum(mongo_pool_checkout_failures.snapshot().values())
+    return {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS or None,
+        "maxTimeMS": MONGO_MAX_TIME_MS or None,
+        "servers": [
+            {"address": labels[0], "open": int(count), "checkedOut": int(checked_out.get(labels, 0))}
+            for labels, count in sorted(open_connections.items())
+        ],
+        "checkoutFailures": int(failures)
+    }
+
+@api_router.get("/ready")
+async def get_readiness():
+    """Report whether this worker can reach MongoDB, with its connection pool state"""
+    data = {"pid": os.getpid(), "database": "unavailable", "pool": None}
+    if db is None:
+        return JSONResponse(
+            status_code=503,
+            content=ApiResponse(success=False, data=data, error="MongoDB client not started", message="Not ready").dict()
+        )
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(db.command("ping"), MONGO_READY_TIMEOUT_MS / 1000)
+    except Exception as e:
+        data["pool"] = mongo_pool_state()
+        return JSONResponse(
+            status_code=503,
+            content=ApiResponse(success=False, data=data, error=str(e) or type(e).__name__, message="Not ready").dict()
+        )
+    data["database"] = "ok"
+    data["pingMs"] = round((time.perf_counter() - start) * 1000, 2)
+    data["pool"] = mongo_pool_state()
+    return ApiResponse(success=True, data=data, message="Ready")
+
+# Admission control and load shedding
+class ConcurrencyLimiter:
+    """Concurrency cap for one route group with a bounded, time-limited wait queue"""
+
+    def __init__(self, name: str, limit: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+
+    async def acquire(self) -> bool:
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.shed += 1
+                return False
+            self.waiting += 1
+            self.queued += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.shed += 1
+                return False
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def release(self):
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "maxQueue": self.max_queue,
+            "inFlight": self.in_flight,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+        }
+
+class TokenBucketLimiter:
+    """Per-client token buckets, kept for at most max_clients recent clients"""
+
+    def __init__(self, rate: float, burst: float, max_clients: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+        self.allowed = 0
+        self.limited = 0
+
+    def take(self, client_id: str) -> float:
+        """Consume a token; returns 0 when allowed, else seconds until a token is available"""
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(client_id, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+            self.allowed += 1
+        else:
+            wait = (1 - tokens) / self.rate
+            self.limited += 1
+        self._buckets[client_id] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "clients": len(self._buckets),
+            "allowed": self.allowed,
+            "limited": self.limited,
+        }
+
+ADMISSION_CONTROL = os.environ.get('ADMISSION_CONTROL', 'true').lower() == 'true'
+ADMISSION_RETRY_AFTER = int(os.environ.get('ADMISSION_RETRY_AFTER_SECONDS', '1'))
+ADMISSION_EXEMPT_PATHS = {"/api/admission/stats", "/api/ready"}
+
+admission_limiters = {
+    "read": ConcurrencyLimiter(
+        "read",
+        limit=int(os.environ.get('READ_CONCURRENCY', '64')),
+        max_queue=int(os.environ.get('READ_QUEUE', '256')),
+        queue_timeout=float(os.environ.get('READ_QUEUE_TIMEOUT_SECONDS', '2')),
+    ),
+    "contact": ConcurrencyLimiter(
+        "contact",
+        limit=int(os.environ.get('CONTACT_CONCURRENCY', '16')),
+        max_queue=int(os.environ.get('CONTACT_QUEUE', '64')),
+        queue_timeout=float(os.environ.get('CONTACT_QUEUE_TIMEOUT_SECONDS', '2')),
+    ),
+    "admin": ConcurrencyLimiter(
+        "admin",
+        limit=int(os.environ.get('ADMIN_CONCURRENCY', '4')),
+        max_queue=int(os.environ.get('ADMIN_QUEUE', '16')),
+        queue_timeout=float(os.environ.get('ADMIN_QUEUE_TIMEOUT_SECONDS', '5')),
+    ),
+}
+
+# Behind an ingress every request arrives from the proxy's address, so the
+# contact rate limit keys on X-Forwarded-For when the peer is one of
+# TRUSTED_PROXIES ("*" trusts whichever peer connects, but only that one hop,
+# so the right-most X-Forwarded-For entry is used). The limit stays off by default until a
+# trusted proxy is configured; set CONTACT_RATE_LIMIT=true when uvicorn's
+# --proxy-headers already rewrites the client address.
+TRUSTED_PROXIES = {address.strip() for address in os.environ.get('TRUSTED_PROXIES', '').split(',') if address.strip()}
+CONTACT_RATE_LIMIT = os.environ.get('CONTACT_RATE_LIMIT', 'true' if TRUSTED_PROXIES else 'false').lower() == 'true'
+
+def client_address(scope) -> str:
+    """The visitor's address: the nearest X-Forwarded-For hop not added by a trusted proxy"""
+    peer = scope["client"][0] if scope.get("client") else "unknown"
+    if "*" not in TRUSTED_PROXIES and peer not in TRUSTED_PROXIES:
+        return peer
+    forwarded = [
+        value.decode("latin-1") for name, value in scope.get("headers", []) if name == b"x-forwarded-for"
+    ]
+    hops = [hop.strip() for hop in ",".join(forwarded).split(",") if hop.strip()]
+    if not hops:
+        return peer
+    if "*" in TRUSTED_PROXIES:
+        # Only the connecting peer is known to be a proxy; earlier hops are client-supplied
+        return hops[-1]
+    for hop in reversed(hops):
+        if hop not in TRUSTED_PROXIES:
+            return hop
+    return hops[0]
+
+contact_rate_limiter = TokenBucketLimiter(
+    rate=float(os.environ.get('CONTACT_RATE_PER_SECOND', '0.2')),
+    burst=float(os.environ.get('CONTACT_BURST', '5')),
+)
+
+# POST endpoints that only read, because their input is too long for a query string
+READ_ONLY_POSTS = {"/api/projects/lookup"}
+
+def admission_group(method: str, path: str) -> Optional[str]:
+    """Route group for a request, or None for requests that bypass admission control"""
+    if not path.startswith("/api/") or path in ADMISSION_EXEMPT_PATHS or method == "OPTIONS":
+        return None
+    if path == "/api/contact" and method == "POST":
+        return "contact"
+    if path == "/api/contact" or path.startswith("/api/contact/"):
+        return "admin"
+    if method in ("GET", "HEAD") or (method == "POST" and path in READ_ONLY_POSTS):
+        return "read"
+    # Seeding and every create endpoint
+    return "admin"
+
+async def _send_rejection(send, status_code: int, retry_after: int, message: str):
+    body = encode_json(api_envelope(False, None, message, "Server is busy, please retry later"))
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(retry_after).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+class AdmissionControlMiddleware:
+    """ASGI middleware applying per-group concurrency limits and the contact rate limit"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        group = admission_group(scope["method"], scope["path"])
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if group == "contact" and CONTACT_RATE_LIMIT:
+            wait = contact_rate_limiter.take(client_address(scope))
+            if wait:
+                await _send_rejection(send, 429, math.ceil(wait), "Too many messages, please slow down")
+                return
+        
+        limiter = admission_limiters[group]
+        if not await limiter.acquire():
+            await _send_rejection(send, 503, ADMISSION_RETRY_AFTER, "Service temporarily overloaded")
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+@api_router.get("/admission/stats")
+async def get_admission_stats():
+    """Get admitted/queued/shed counters per route group"""
+    return ApiResponse(
+        success=True,
+        data={
+            "enabled": ADMISSION_CONTROL,
+            "groups": {name: limiter.stats() for name, limiter in admission_limiters.items()},
+            "contactRateLimit": {"enabled": CONTACT_RATE_LIMIT, **contact_rate_limiter.stats()}
+        },
+        message="Admission statistics retrieved successfully"
+    )
+
+# Request metrics
+class MetricsMiddleware:
+    """Records request count, in-flight requests and latency per route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status_holder = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec()
+            # The router stores the matched route in the scope; use its template to bound cardinality
+            route = scope.get("route")
+            labels = (scope["method"], route.path if route is not None else "unmatched", str(status_holder[0]))
+            http_requests_total.inc(labels)
+            http_request_duration.observe(labels, elapsed)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus exposition of request and MongoDB metrics"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 # Include the router in the main app
-app.include_router(api_router)
+app.include_router(api_router, default_response_class=FastJSONResponse)
+
+# Added before CORS so that shed responses still carry CORS headers
+if ADMISSION_CONTROL:
+    app.add_middleware(AdmissionControlMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -596,6 +2798,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(CompressionMiddleware)
+
+# Outermost, so shed and rate-limited responses are measured too
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -603,6 +2811,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+async def warm_up_mongo():
+    """Open the pool before the first request instead of during it"""
+    # Concurrent pings check out (and so create) up to minPoolSize connections
+    pings = max(MONGO_MIN_POOL_SIZE, 1)
+    try:
+        await asyncio.gather(*(db.command("ping") for _ in range(pings)))
+    except Exception as e:
+        # Serve anyway; /api/ready reports the database as unavailable until it answers
+        logger.error("MongoDB warm-up ping failed: %s", e)
+
+async def create_indexes():
+    if os.environ.get('ENSURE_INDEXES', 'true').lower() != 'true':
+        return
+    try:
+        await ensure_indexes()
+    except Exception as e:
+        # Serve without the indexes rather than refusing to start
+        logger.error("Failed to ensure indexes: %s", e)
+
+def start_contact_write_behind():
+    if CONTACT_WRITE_BEHIND:
+        contact_write_behind.start()
@@ -8,8 +8,13 @@ import requests
 import json
 import sys
 import os
+import math
+import time
+import random
+import asyncio
+import argparse
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Load environment variables
 def load_env_file(file_path: str) -> Dict[str, str]:
@@ -436,10 +441,17 @@ class APITester:
             
             # Test invalid project ID
             response = self.session.get(f"{API_BASE_URL}/projects/invalid-id", timeout=10)
-            if response.status_code in [400, 404, 500]:  # Any error status is acceptable
-                self.log_test("Invalid ID Handling", True, f"Invalid ID handled with status: {response.status_code}")
+            if response.status_code == 422:
+                self.log_test("Invalid ID Handling", True, "Malformed ID returns 422")
             else:
-                self.log_test("Invalid ID Handling", False, f"Unexpected status: {response.status_code}")
+                self.log_test("Invalid ID Handling", False, f"Status: {response.status_code}")
+            
+            # Test a well-formed project ID that does not exist
+            response = self.session.get(f"{API_BASE_URL}/projects/{'0' * 24}", timeout=10)
+            if response.status_code == 404:
+                self.log_test("Missing Project Handling", True, "Unknown ID returns 404")
+            else:
+                self.log_test("Missing Project Handling", False, f"Status: {response.status_code}")
             
             # Test malformed JSON
             response = self.session.post(f"{API_BASE_URL}/skills", 
@@ -544,7 +556,232 @@ class APITester:
             'all_results': self.test_results
         }
 
+# Load generation mode: drives a weighted mix of the endpoint calls above
+# concurrently and reports latency percentiles, throughput and error rate.
+LOAD_ENDPOINTS = {
+    "portfolio": ("GET", "/portfolio"),
+    "skills": ("GET", "/skills"),
+    "projects": ("GET", "/projects"),
+    "project_detail": ("GET", "/projects/{project_id}"),
+    "education": ("GET", "/education"),
+    "bootstrap": ("GET", "/bootstrap"),
+    "contacts": ("GET", "/contact"),
+    "contact_submit": ("POST", "/contact"),
+}
+
+# Read-heavy by default; contact_submit writes to the real inbox, so it is opt-in
+DEFAULT_LOAD_MIX = "portfolio=3,skills=2,projects=3,project_detail=1,education=2,bootstrap=3"
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse 'name=weight,...' into a weight per endpoint"""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in LOAD_ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}', choose from: {', '.join(LOAD_ENDPOINTS)}")
+        weights[name] = float(weight or 1)
+    return {name: weight for name, weight in weights.items() if weight > 0}
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    # round() first so float noise (0.7 * 10 = 7.000000000000001) cannot push the rank up
+    rank = max(1, math.ceil(round(fraction * len(sorted_values), 9)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+class LoadTester:
+    def __init__(self, api_base_url: str, mix: Dict[str, float], concurrency: int,
+                 duration: float, rate: Optional[float] = None, timeout: float = 10):
+        self.api_base_url = api_base_url
+        self.mix = mix
+        self.concurrency = concurrency
+        self.duration = duration
+        self.rate = rate
+        self.timeout = timeout
+        self.latencies: Dict[str, List[float]] = {name: [] for name in mix}
+        self.errors: Dict[str, int] = {name: 0 for name in mix}
+        self.status_counts: Dict[str, Dict[str, int]] = {name: {} for name in mix}
+        self.project_ids: List[str] = []
+        self.elapsed = 0.0
+    
+    def pick_endpoint(self) -> str:
+        names = list(self.mix)
+        return random.choices(names, weights=[self.mix[name] for name in names])[0]
+    
+    async def load_project_ids(self, client):
+        """Fetch project ids once so project_detail has something to request"""
+        response = await client.get(f"{self.api_base_url}/projects")
+        data = response.json().get("data") or []
+        if isinstance(data, dict):
+            data = data.get("items", [])
+        self.project_ids = [project.get("_id") or project.get("id") for project in data if isinstance(project, dict)]
+    
+    async def call(self, client, name: str, started: Optional[float] = None):
+        method, path = LOAD_ENDPOINTS[name]
+        if "{project_id}" in path:
+            path = path.format(project_id=random.choice(self.project_ids) if self.project_ids else "000000000000000000000000")
+        body = None
+        if name == "contact_submit":
+            body = {
+                "name": "Load Test",
+                "email": "load.test@example.com",
+                "subject": "Load test message",
+                "message": "Generated by backend_test.py --load"
+            }
+        # In rate mode latency is measured from the scheduled start, so queueing delay is not hidden
+        started = started if started is not None else time.perf_counter()
+        status = "error"
+        try:
+            response = await client.request(method, f"{self.api_base_url}{path}", json=body, timeout=self.timeout)
+            status = str(response.status_code)
+            if response.status_code >= 400:
+                self.errors[name] += 1
+        except Exception:
+            self.errors[name] += 1
+        self.latencies[name].append(time.perf_counter() - started)
+        self.status_counts[name][status] = self.status_counts[name].get(status, 0) + 1
+    
+    async def run_closed_loop(self, client):
+        """Each worker issues its next request as soon as the previous one finishes"""
+        deadline = time.perf_counter() + self.duration
+        
+        async def worker():
+            while time.perf_counter() < deadline:
+                await self.call(client, self.pick_endpoint())
+        
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+    
+    async def run_open_loop(self, client):
+        """Start requests on a fixed schedule, capped at `concurrency` in flight"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        interval = 1.0 / self.rate
+        start = time.perf_counter()
+        tasks = []
+        
+        async def scheduled(name: str, scheduled_at: float):
+            async with semaphore:
+                await self.call(client, name, started=scheduled_at)
+        
+        sent = 0
+        while True:
+            scheduled_at = start + sent * interval
+            if scheduled_at - start >= self.duration:
+                break
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(scheduled(self.pick_endpoint(), scheduled_at)))
+            sent += 1
+        await asyncio.gather(*tasks)
+    
+    async def run(self):
+        try:
+            import httpx
+        except ImportError:
+            print("Load mode requires httpx: pip install httpx")
+            sys.exit(2)
+        
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        async with httpx.AsyncClient(limits=limits) as client:
+            if "project_detail" in self.mix:
+                await self.load_project_ids(client)
+            start = time.perf_counter()
+            if self.rate:
+                await self.run_open_loop(client)
+            else:
+                await self.run_closed_loop(client)
+            self.elapsed = time.perf_counter() - start
+    
+    def summarize(self, latencies: List[float], errors: int) -> Dict[str, Any]:
+        ordered = sorted(latencies)
+        count = len(ordered)
+        return {
+            "requests": count,
+            "errors": errors,
+            "error_rate": errors / count if count else 0.0,
+            "throughput_rps": count / self.elapsed if self.elapsed else 0.0,
+            "latency_ms": {
+                "mean": (sum(ordered) / count * 1000) if count else 0.0,
+                "p50": percentile(ordered, 0.50) * 1000,
+                "p90": percentile(ordered, 0.90) * 1000,
+                "p99": percentile(ordered, 0.99) * 1000,
+                "max": (ordered[-1] * 1000) if count else 0.0,
+            },
+        }
+    
+    def report(self) -> Dict[str, Any]:
+        endpoints = {}
+        for name in self.mix:
+            endpoints[name] = self.summarize(self.latencies[name], self.errors[name])
+            endpoints[name]["status_codes"] = self.status_counts[name]
+        all_latencies = [value for values in self.latencies.values() for value in values]
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "api_base_url": self.api_base_url,
+            "config": {
+                "mix": self.mix,
+                "concurrency": self.concurrency,
+                "duration": self.duration,
+                "rate": self.rate,
+            },
+            "elapsed": self.elapsed,
+            "total": self.summarize(all_latencies, sum(self.errors.values())),
+            "endpoints": endpoints,
+        }
+    
+    def print_report(self, report: Dict[str, Any]):
+        print("\n" + "=" * 96)
+        print("🚀 LOAD TEST RESULTS")
+        print("=" * 96)
+        header = f"{'endpoint':<16} {'reqs':>7} {'rps':>8} {'err%':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+        print(header)
+        print("-" * len(header))
+        rows = list(report["endpoints"].items()) + [("TOTAL", report["total"])]
+        for name, stats in rows:
+            latency = stats["latency_ms"]
+            print(f"{name:<16} {stats['requests']:>7} {stats['throughput_rps']:>8.1f} "
+                  f"{stats['error_rate'] * 100:>5.1f}% {latency['p50']:>9.2f} {latency['p90']:>9.2f} "
+                  f"{latency['p99']:>9.2f} {latency['max']:>9.2f}")
+
+def run_load_test(args) -> int:
+    tester = LoadTester(
+        api_base_url=args.base_url.rstrip("/") + "/api" if args.base_url else API_BASE_URL,
+        mix=parse_mix(args.mix),
+        concurrency=args.concurrency,
+        duration=args.duration,
+        rate=args.rate,
+        timeout=args.timeout,
+    )
+    print(f"Load testing {tester.api_base_url} for {args.duration:.0f}s "
+          f"({'%.1f req/s' % args.rate if args.rate else 'closed loop'}, concurrency {args.concurrency})")
+    asyncio.run(tester.run())
+    report = tester.report()
+    tester.print_report(report)
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 1 if report["total"]["errors"] else 0
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Space Portfolio backend API tests")
+    parser.add_argument("--load", action="store_true", help="run the load generator instead of the functional tests")
+    parser.add_argument("--base-url", help="backend URL, defaults to REACT_APP_BACKEND_URL")
+    parser.add_argument("--mix", default=DEFAULT_LOAD_MIX, help="weighted endpoint mix, e.g. portfolio=3,skills=1")
+    parser.add_argument("--concurrency", type=int, default=10, help="concurrent requests in flight")
+    parser.add_argument("--duration", type=float, default=30, help="test duration in seconds")
+    parser.add_argument("--rate", type=float, help="target requests/sec (open loop); omit for closed loop")
+    parser.add_argument("--timeout", type=float, default=10, help="per-request timeout in seconds")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.load:
+        sys.exit(run_load_test(args))
+    
     tester = APITester()
     results = tester.run_all_tests()
     
@@ -29,12 +29,43 @@ apiClient.interceptors.response.use(
   }
 );
 
+// All read-only sections are fetched once through /bootstrap on first paint;
+// components share the same in-flight request.
+let bootstrapPromise = null;
+
+const getBootstrapSection = async (section, path) => {
+  if (!bootstrapPromise) {
+    bootstrapPromise = apiClient.get('/bootstrap').catch((error) => {
+      bootstrapPromise = null;
+      throw error;
+    });
+  }
+  try {
+    const data = await bootstrapPromise;
+    return data[section];
+  } catch (error) {
+    // Fall back to the individual endpoint if the aggregated call fails
+    return apiClient.get(path);
+  }
+};
+
 // API service methods
 export const portfolioAPI = {
+  // Bootstrap endpoint
+  getBootstrap: async () => {
+    try {
+      const response = await apiClient.get('/bootstrap');
+      return response;
+    } catch (error) {
+      console.error('Failed to fetch bootstrap data:', error);
+      throw error;
+    }
+  },
+
   // Portfolio endpoints
   getPortfolio: async () => {
     try {
-      const response = await apiClient.get('/portfolio');
+      const response = await getBootstrapSection('portfolio', '/portfolio');
       return response;
     } catch (error) {
       console.error('Failed to fetch portfolio:', error);
@@ -45,7 +76,7 @@ export const portfolioAPI = {
   // Skills endpoints
   getSkills: async () => {
     try {
-      const response = await apiClient.get('/skills');
+      const response = await getBootstrapSection('skills', '/skills');
       return response;
     } catch (error) {
       console.error('Failed to fetch skills:', error);
@@ -66,7 +97,7 @@ export const portfolioAPI = {
   // Projects endpoints
   getProjects: async () => {
     try {
-      const response = await apiClient.get('/projects');
+      const response = await getBootstrapSection('projects', '/projects');
       return response;
     } catch (error) {
       console.error('Failed to fetch projects:', error);
@@ -97,7 +128,7 @@ export const portfolioAPI = {
   // Education endpoints
   getEducation: async () => {
     try {
-      const response = await apiClient.get('/education');
+      const response = await getBootstrapSection('education', '/education');
       return response;
     } catch (error) {
       console.error('Failed to fetch education:', error);
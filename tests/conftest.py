@@ -0,0 +1,11 @@
+import os
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+
+# server reads these at import time; backend/.env fills in anything unset
+os.environ.setdefault("ADMISSION_CONTROL", "false")
+os.environ.setdefault("ENSURE_INDEXES", "false")
+
+sys.path.insert(0, str(BACKEND_DIR))
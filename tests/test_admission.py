@@ -0,0 +1,31 @@
+import server
+
+
+def scope(peer, forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return {"type": "http", "client": (peer, 1234), "headers": headers}
+
+
+def test_client_address_ignores_forwarded_for_from_untrusted_peer(monkeypatch):
+    monkeypatch.setattr(server, "TRUSTED_PROXIES", {"10.0.0.1"})
+    assert server.client_address(scope("203.0.113.9", "198.51.100.7")) == "203.0.113.9"
+
+
+def test_client_address_uses_nearest_untrusted_hop(monkeypatch):
+    monkeypatch.setattr(server, "TRUSTED_PROXIES", {"10.0.0.1", "10.0.0.2"})
+    # The left-most hop is client-supplied and cannot be trusted
+    request = scope("10.0.0.1", "1.2.3.4, 198.51.100.7, 10.0.0.2")
+    assert server.client_address(request) == "198.51.100.7"
+
+
+def test_client_address_without_forwarded_for(monkeypatch):
+    monkeypatch.setattr(server, "TRUSTED_PROXIES", {"*"})
+    assert server.client_address(scope("10.0.0.1")) == "10.0.0.1"
+
+
+
+def test_client_address_wildcard_trusts_only_the_peer(monkeypatch):
+    monkeypatch.setattr(server, "TRUSTED_PROXIES", {"*"})
+    # A spoofed left-most hop must not be mistaken for the client
+    request = scope("10.0.0.1", "6.6.6.6, 203.0.113.5")
+    assert server.client_address(request) == "203.0.113.5"
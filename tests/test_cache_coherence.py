@@ -0,0 +1,40 @@
+"""
+Runs backend/check_cache_coherence.py: several uvicorn workers share one
+database, and a project created through one worker must show up on every
+other worker within the version poll interval. Needs a reachable MongoDB
+(MONGO_URL from backend/.env, or TEST_MONGO_URL); skipped otherwise.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("uvicorn")
+
+import check_cache_coherence  # noqa: E402
+import server  # noqa: E402
+
+MONGO_URL = os.environ.get("TEST_MONGO_URL", server.mongo_url)
+TEST_DB_NAME = os.environ.get("DB_NAME", "test_database") + "_coherence"
+
+
+def mongo_reachable():
+    from pymongo import MongoClient
+    client = MongoClient(MONGO_URL, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+        return True
+    except Exception:
+        return False
+    finally:
+        client.close()
+
+
+def test_workers_converge_within_poll_interval():
+    if not mongo_reachable():
+        pytest.skip(f"MongoDB not reachable at {MONGO_URL}")
+    results = check_cache_coherence.run_check(MONGO_URL, TEST_DB_NAME, workers=3, poll_interval=0.5, slack=0.5)
+    assert len(results) == 3
+    for url, ok, delay in results:
+        assert ok, f"{url} consistent only after {delay * 1000:.0f} ms"
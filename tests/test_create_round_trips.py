@@ -0,0 +1,102 @@
+"""
+Counts the MongoDB commands each create handler issues, using pymongo
+command monitoring. Needs a reachable MongoDB (MONGO_URL from backend/.env,
+or TEST_MONGO_URL); skipped otherwise.
+"""
+
+import asyncio
+import os
+from collections import Counter
+
+import pytest
+from pymongo import monitoring
+
+httpx = pytest.importorskip("httpx")
+
+import server  # noqa: E402
+
+MONGO_URL = os.environ.get("TEST_MONGO_URL", server.mongo_url)
+TEST_DB_NAME = os.environ.get("DB_NAME", "test_database") + "_round_trips"
+
+PROJECT = {
+    "title": "Round Trip Project",
+    "description": "Counts commands",
+    "duration": "1 Day",
+    "technologies": ["Python"],
+    "features": ["Monitoring"],
+    "responsibilities": [],
+    "liveDemo": "https://example.com",
+    "github": "https://github.com/example/round-trip",
+    "image": "https://example.com/image.png",
+}
+SKILL = {"category": "tools", "name": "Docker", "level": 80, "categoryType": "DevOps"}
+EDUCATION = {"degree": "MSc", "institution": "Uni", "board": "B", "stream": "CS", "performance": "80%", "year": "2025"}
+CONTACT = {"name": "Round Trip", "email": "round.trip@example.com", "subject": "Hi", "message": "Counting commands"}
+
+CREATES = {
+    "/api/projects": ("projects", PROJECT),
+    "/api/skills": ("skills", SKILL),
+    "/api/education": ("education", EDUCATION),
+    # Inline insert; CONTACT_WRITE_BEHIND is off by default
+    "/api/contact": ("contact", CONTACT),
+}
+
+
+def expected_commands(collection):
+    """One insert plus the $inc on the shared cache_versions document; never a find"""
+    return Counter({("insert", collection): 1, ("findAndModify", "cache_versions"): 1})
+
+
+class CommandRecorder(monitoring.CommandListener):
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        if event.database_name == TEST_DB_NAME:
+            value = event.command.get(event.command_name)
+            self.commands.append((event.command_name, value if isinstance(value, str) else None))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def run_creates():
+    recorder = CommandRecorder()
+
+    async def scenario():
+        client = server.AsyncIOMotorClient(MONGO_URL, serverSelectionTimeoutMS=1000, event_listeners=[recorder])
+        try:
+            try:
+                await client.admin.command("ping")
+            except Exception as e:
+                pytest.skip(f"MongoDB not reachable at {MONGO_URL}: {e}")
+            original_db = server.db
+            server.db = client[TEST_DB_NAME]
+            commands_by_path = {}
+            try:
+                transport = httpx.ASGITransport(app=server.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as api:
+                    for path, (_, body) in CREATES.items():
+                        recorder.commands.clear()
+                        response = await api.post(path, json=body)
+                        assert response.status_code == 200, response.text
+                        commands_by_path[path] = list(recorder.commands)
+            finally:
+                server.db = original_db
+                await client.drop_database(TEST_DB_NAME)
+            return commands_by_path
+        finally:
+            client.close()
+
+    return asyncio.run(scenario())
+
+
+def test_create_handlers_issue_one_insert_and_no_find():
+    assert not server.CONTACT_WRITE_BEHIND
+    for path, commands in run_creates().items():
+        collection = CREATES[path][0]
+        assert not any(name == "find" for name, _ in commands), (path, commands)
+        assert Counter(commands) == expected_commands(collection), (path, commands)
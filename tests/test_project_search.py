@@ -0,0 +1,73 @@
+import asyncio
+import random
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+import server  # noqa: E402
+
+
+def build_index(monkeypatch, docs):
+    monkeypatch.setattr(server, "db", mongomock_motor.AsyncMongoMockClient()["search_test"])
+    monkeypatch.setitem(server.collection_versions, "projects", server.collection_versions["projects"] + 1)
+
+    async def build():
+        await server.db.projects.insert_many(docs)
+        index = server.ProjectSearchIndex()
+        await index.ensure_current()
+        return index
+    return asyncio.run(build())
+
+
+def paged(index, query, limit):
+    ids = []
+    offset = 0
+    while True:
+        ranked, has_more = index.search(query, offset + limit)
+        ids.extend(ranked[offset:])
+        if not has_more:
+            return ids
+        offset += limit
+
+
+def test_paging_matches_single_query_when_projects_tie(monkeypatch):
+    # Seed and bulk inserts share createdAt at millisecond precision
+    created_at = datetime(2024, 1, 1)
+    docs = [
+        {"_id": ObjectId(), "title": "Spring service", "technologies": ["Java"], "isActive": True, "createdAt": created_at}
+        for _ in range(40)
+    ]
+    index = build_index(monkeypatch, docs)
+
+    full, has_more = index.search("spring", 1000)
+    assert not has_more
+    assert len(full) == 40
+    assert full == sorted(full)  # equal score and createdAt: lowest id first
+    for limit in (1, 3, 5, 7, 40):
+        assert paged(index, "spring", limit) == full
+
+
+def test_paging_matches_single_query_on_mixed_scores(monkeypatch):
+    rng = random.Random(7)
+    words = ["java", "spring", "mysql", "react", "docker", "kotlin"]
+    dates = [datetime(2024, 1, day) for day in (1, 2, 3)]
+    docs = [
+        {
+            "_id": ObjectId(),
+            "title": " ".join(rng.choices(words, k=2)),
+            "technologies": rng.sample(words, 2),
+            "isActive": True,
+            "createdAt": rng.choice(dates),
+        }
+        for _ in range(120)
+    ]
+    index = build_index(monkeypatch, docs)
+
+    for _ in range(50):
+        query = " ".join(rng.sample(words, rng.randint(1, 3)))
+        full, _ = index.search(query, 1000)
+        assert len(set(full)) == len(full)
+        assert paged(index, query, rng.randint(1, 9)) == full